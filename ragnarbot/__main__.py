@@ -2,7 +2,7 @@
 Entry point for running ragnarbot as a module: python -m ragnarbot
 """
 
-from ragnarbot.cli.commands import app
+from ragnarbot.cli import main
 
 if __name__ == "__main__":
-    app()
+    main()
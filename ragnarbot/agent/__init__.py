@@ -1,8 +1,26 @@
-"""Agent core module."""
+"""Agent core module.
 
-from ragnarbot.agent.loop import AgentLoop
-from ragnarbot.agent.context import ContextBuilder
-from ragnarbot.agent.memory import MemoryStore
-from ragnarbot.agent.skills import SkillsLoader
+Exports are resolved lazily (PEP 562) so importing a submodule such as
+``ragnarbot.agent.context`` doesn't drag in the agent loop and its
+provider/tool stack.
+"""
 
-__all__ = ["AgentLoop", "ContextBuilder", "MemoryStore", "SkillsLoader"]
+import importlib
+
+_EXPORTS = {
+    "AgentLoop": "ragnarbot.agent.loop",
+    "ContextBuilder": "ragnarbot.agent.context",
+    "MemoryStore": "ragnarbot.agent.memory",
+    "SkillsLoader": "ragnarbot.agent.skills",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -1,11 +1,19 @@
 """Context builder for assembling agent prompts."""
 
-import base64
+import functools
 import mimetypes
 import shutil
 from pathlib import Path
 from typing import Any
 
+try:
+    from pybase64 import b64encode_as_string as _b64encode
+except ImportError:  # optional SIMD encoder; stdlib fallback
+    import base64
+
+    def _b64encode(data: bytes) -> str:
+        return base64.b64encode(data).decode()
+
 from ragnarbot.agent.memory import MemoryStore
 from ragnarbot.agent.skills import SkillsLoader
 
@@ -13,6 +21,43 @@ DEFAULTS_DIR = Path(__file__).parent.parent / "workspace_defaults"
 BUILTIN_DIR = Path(__file__).parent.parent / "builtin"
 
 
+@functools.lru_cache(maxsize=256)
+def _guess_mime(suffix: str) -> str | None:
+    """Guess a MIME type from a lowercase file suffix (e.g. ".jpg")."""
+    return mimetypes.guess_type(f"file{suffix}")[0]
+
+
+# Encoded data URLs are ~4/3 the file size and the cache is process-wide,
+# so keep it small and leave large images out of it entirely.
+_IMAGE_CACHE_ENTRIES = 8
+_IMAGE_CACHE_MAX_BYTES = 512 * 1024
+
+
+def _encode_image(path: str, mime: str) -> str:
+    """Read and base64-encode an image as a data URL."""
+    b64 = _b64encode(Path(path).read_bytes())
+    return f"data:{mime};base64,{b64}"
+
+
+@functools.lru_cache(maxsize=_IMAGE_CACHE_ENTRIES)
+def _cached_image_data_url(path: str, mime: str, mtime_ns: int) -> str:
+    """Cached _encode_image; keyed by mtime so edits invalidate it.
+
+    History photos are re-sent on every turn, so caching avoids re-reading
+    and re-encoding the same files each time the context is rebuilt.
+    """
+    return _encode_image(path, mime)
+
+
+def _image_part(path: Path, mime: str) -> dict[str, Any]:
+    st = path.stat()
+    if st.st_size > _IMAGE_CACHE_MAX_BYTES:
+        url = _encode_image(str(path), mime)
+    else:
+        url = _cached_image_data_url(str(path), mime, st.st_mtime_ns)
+    return {"type": "image_url", "image_url": {"url": url}}
+
+
 class ContextBuilder:
     """
     Builds the context (system prompt + messages) for the agent.
@@ -260,11 +305,10 @@ Skills with available="false" need dependencies installed first - you can try in
         if media:
             for path in media:
                 p = Path(path)
-                mime, _ = mimetypes.guess_type(path)
+                mime = _guess_mime(p.suffix.lower())
                 if not p.is_file() or not mime or not mime.startswith("image/"):
                     continue
-                b64 = base64.b64encode(p.read_bytes()).decode()
-                images.append({"type": "image_url", "image_url": {"url": f"data:{mime};base64,{b64}"}})
+                images.append(_image_part(p, mime))
 
         # New: lazy base64-encode from media_refs
         if media_refs and session_key and media_base:
@@ -274,10 +318,8 @@ Skills with available="false" need dependencies installed first - you can try in
                 photo_path = media_base / session_key / "photos" / ref["filename"]
                 if not photo_path.is_file():
                     continue
-                mime, _ = mimetypes.guess_type(str(photo_path))
-                mime = mime or "image/jpeg"
-                b64 = base64.b64encode(photo_path.read_bytes()).decode()
-                images.append({"type": "image_url", "image_url": {"url": f"data:{mime};base64,{b64}"}})
+                mime = _guess_mime(photo_path.suffix.lower()) or "image/jpeg"
+                images.append(_image_part(photo_path, mime))
 
         if not images:
             return text
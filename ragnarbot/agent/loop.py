@@ -27,6 +27,7 @@ from ragnarbot.agent.tools.cron import CronTool
 from ragnarbot.agent.subagent import SubagentManager
 from ragnarbot.media.manager import MediaManager
 from ragnarbot.session.manager import SessionManager
+from ragnarbot.utils.helpers import detect_image_mime
 
 
 class AgentLoop:
@@ -363,27 +364,51 @@ class AgentLoop:
         for m in batch:
             # Process attachments
             media_refs: list[dict[str, str]] = []
-            if self.media_manager:
-                for att in m.attachments:
-                    if att.type == "photo" and att.data:
-                        ext = _ext_from_mime(att.mime_type)
-                        filename = await self.media_manager.save_photo(
-                            session.key, att.data, ext
+            for att in m.attachments:
+                if att.type != "photo":
+                    continue
+                if not self.media_manager:
+                    if att.path:
+                        _discard_staged(att.path)
+                    continue
+                if att.path:
+                    try:
+                        with att.path.open("rb") as f:
+                            head = f.read(16)
+                        ext = _ext_from_mime(detect_image_mime(head) or att.mime_type)
+                        filename = await self.media_manager.store_photo(
+                            session.key, att.path, ext
                         )
-                        media_refs.append({"type": "photo", "filename": filename})
-
-            # Process reply-to photo — save to disk, add to media_refs
-            reply_to = m.metadata.get("reply_to")
-            if reply_to and isinstance(reply_to, dict) and self.media_manager:
-                photo_data = reply_to.pop("photo_data", None)
-                photo_mime = reply_to.pop("photo_mime", None)
-                if photo_data:
-                    ext = _ext_from_mime(photo_mime)
+                    except OSError as e:
+                        logger.error(f"Failed to store photo: {e}")
+                        _discard_staged(att.path)
+                        continue
+                    media_refs.append({"type": "photo", "filename": filename})
+                elif att.data:
+                    ext = _ext_from_mime(detect_image_mime(att.data) or att.mime_type)
                     filename = await self.media_manager.save_photo(
-                        session.key, photo_data, ext
+                        session.key, att.data, ext
                     )
                     media_refs.append({"type": "photo", "filename": filename})
-                    reply_to["has_photo"] = True
+
+            # Process reply-to photo — fetch on demand, save to disk, add to media_refs
+            reply_to = m.metadata.get("reply_to")
+            if reply_to and isinstance(reply_to, dict):
+                photo_file_id = reply_to.pop("photo_file_id", None)
+                photo_mime = reply_to.pop("photo_mime", None)
+                if photo_file_id and self.media_manager:
+                    try:
+                        photo_data = await self.media_manager.fetch(
+                            photo_file_id, m.channel
+                        )
+                        ext = _ext_from_mime(detect_image_mime(photo_data) or photo_mime)
+                        filename = await self.media_manager.save_photo(
+                            session.key, photo_data, ext
+                        )
+                        media_refs.append({"type": "photo", "filename": filename})
+                        reply_to["has_photo"] = True
+                    except Exception as e:
+                        logger.error(f"Failed to fetch reply photo: {e}")
 
             # Build prefix tags (timestamp only on the first message in the batch)
             is_first = m is batch[0]
@@ -1013,3 +1038,11 @@ def _ext_from_mime(mime_type: str) -> str:
         "image/webp": "webp",
     }
     return mapping.get(mime_type, "jpg")
+
+
+def _discard_staged(path: Path) -> None:
+    """Remove a staged download nobody took ownership of."""
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Failed to remove staged file {path}: {e}")
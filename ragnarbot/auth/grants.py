@@ -3,9 +3,13 @@
 import json
 import secrets
 import string
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
+GRANT_TTL_SECONDS = 24 * 60 * 60
+MAX_PENDING_GRANTS = 100
+
 
 @dataclass
 class GrantInfo:
@@ -20,6 +24,8 @@ class PendingGrantStore:
     Stores codes at ~/.ragnarbot/pending_grants.json.
     Codes are 8-character hex strings generated via secrets.token_hex(4).
     If the same user_id already has a pending grant, the existing code is reused.
+    Codes expire after GRANT_TTL_SECONDS, and at most MAX_PENDING_GRANTS are
+    kept (oldest evicted first) so unanswered requests don't pile up.
     """
 
     def __init__(self, path: Path | None = None):
@@ -33,13 +39,27 @@ class PendingGrantStore:
                 return {}
         return {}
 
+    @staticmethod
+    def _prune(data: dict) -> dict:
+        """Drop expired codes and cap the store at MAX_PENDING_GRANTS."""
+        now = time.time()
+        # Entries written before expiry existed carry no timestamp; date them now.
+        live = {
+            code: info for code, info in data.items()
+            if now - info.setdefault("created_at", now) < GRANT_TTL_SECONDS
+        }
+        if len(live) > MAX_PENDING_GRANTS:
+            newest = sorted(live, key=lambda c: live[c]["created_at"])[-MAX_PENDING_GRANTS:]
+            live = {code: live[code] for code in newest}
+        return live
+
     def _save(self, data: dict) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._path.write_text(json.dumps(data, indent=2))
 
     def get_or_create(self, user_id: str, chat_id: str) -> str:
         """Return an existing code for user_id, or create a new one."""
-        data = self._load()
+        data = self._prune(self._load())
 
         # Check if user already has a pending code
         for code, info in data.items():
@@ -52,13 +72,13 @@ class PendingGrantStore:
         # Generate new code (mixed-case alphanumeric)
         alphabet = string.ascii_letters + string.digits
         code = ''.join(secrets.choice(alphabet) for _ in range(8))
-        data[code] = {"user_id": user_id, "chat_id": chat_id}
-        self._save(data)
+        data[code] = {"user_id": user_id, "chat_id": chat_id, "created_at": time.time()}
+        self._save(self._prune(data))
         return code
 
     def validate(self, code: str) -> GrantInfo | None:
         """Validate a code and return grant info, or None if invalid."""
-        data = self._load()
+        data = self._prune(self._load())
         info = data.get(code)
         if info:
             return GrantInfo(user_id=info["user_id"], chat_id=info["chat_id"])
@@ -1,6 +1,7 @@
 """Event types for the message bus."""
 
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 
@@ -10,7 +11,8 @@ class MediaAttachment:
 
     type: str  # "photo" | "file" | "voice" | "audio"
     file_id: str  # Platform file identifier (e.g. Telegram file_id)
-    data: bytes | None = None  # Raw bytes (photos only — downloaded eagerly)
+    data: bytes | None = None  # Raw bytes (in-memory photos)
+    path: Path | None = None  # On-disk file (staged photos — read on demand)
     filename: str = ""  # Cosmetic filename (optional)
     mime_type: str = ""
 
@@ -1,7 +1,10 @@
 """Telegram channel implementation using python-telegram-bot."""
 
 import asyncio
+import os
 import re
+import tempfile
+from pathlib import Path
 
 import telegram
 from loguru import logger
@@ -96,6 +99,9 @@ def _markdown_to_telegram_html(text: str) -> str:
 TELEGRAM_MAX_LENGTH = 4096
 _TAG_OVERHEAD = 100  # Reserve space for closing/reopening tags across splits
 
+TRANSCRIPTION_CONCURRENCY = 2  # Transcriptions running at once
+TRANSCRIPTION_QUEUE_LIMIT = 8  # Running + waiting; beyond this, reply "busy"
+
 
 def _avoid_tag_split(text: str, pos: int) -> int:
     """Adjust split position to avoid splitting inside an HTML tag."""
@@ -229,12 +235,14 @@ class TelegramChannel(BaseChannel):
         self.config: TelegramConfig = config
         self.bot_token = bot_token
         self._transcriber = transcription_provider
-        self._transcription_semaphore = asyncio.Semaphore(2)
+        self._transcription_semaphore = asyncio.Semaphore(TRANSCRIPTION_CONCURRENCY)
+        self._transcription_pending = 0
         self.media_manager = media_manager
         self._app: Application | None = None
         self._chat_ids: dict[str, int] = {}  # Map sender_id to chat_id for replies
         self._typing_tasks: dict[int, asyncio.Task] = {}
         self._grants = PendingGrantStore()
+        self._stop_event = asyncio.Event()
     
     async def start(self) -> None:
         """Start the Telegram bot with long polling."""
@@ -243,6 +251,7 @@ class TelegramChannel(BaseChannel):
             return
 
         self._running = True
+        self._stop_event.clear()
 
         # Build the application
         self._app = (
@@ -301,12 +310,12 @@ class TelegramChannel(BaseChannel):
         )
 
         # Keep running until stopped
-        while self._running:
-            await asyncio.sleep(1)
+        await self._stop_event.wait()
     
     async def stop(self) -> None:
         """Stop the Telegram bot."""
         self._running = False
+        self._stop_event.set()
         
         if self._app:
             logger.info("Stopping Telegram bot...")
@@ -650,23 +659,35 @@ class TelegramChannel(BaseChannel):
         if message.caption:
             content_parts.append(message.caption)
 
-        # --- Photos: eager download into memory (no disk save yet) ---
-        if message.photo and self._app:
+        # --- Photos: eager download to a staging file (moved per-session later) ---
+        # Only for allowed senders: anyone else is dropped by _handle_message,
+        # so staging their photos would just fill the disk.
+        if message.photo and self._app and self.is_allowed(sender_id):
             photo = message.photo[-1]  # Largest resolution
+            file_path: Path | None = None
             try:
                 file = await self._app.bot.get_file(photo.file_id)
-                data = await file.download_as_bytearray()
+                media_dir = Path.home() / ".ragnarbot" / "media"
+                media_dir.mkdir(parents=True, exist_ok=True)
+                # Unique staging name: file_id prefixes are shared across photos,
+                # and several may be staged at once within the debounce window.
+                fd, name = tempfile.mkstemp(dir=media_dir, prefix="photo_", suffix=".jpg")
+                os.close(fd)
+                file_path = Path(name)
+                await file.download_to_drive(str(file_path))
                 mime = "image/jpeg"  # Telegram photos are always JPEG
                 attachments.append(MediaAttachment(
                     type="photo",
                     file_id=photo.file_id,
-                    data=bytes(data),
+                    path=file_path,
                     mime_type=mime,
                 ))
-                logger.debug(f"Downloaded photo {photo.file_id[:16]} into memory")
+                logger.debug(f"Downloaded photo {photo.file_id[:16]} to {file_path}")
             except Exception as e:
                 logger.error(f"Failed to download photo: {e}")
                 content_parts.append("[photo: download failed]")
+                if file_path:
+                    file_path.unlink(missing_ok=True)
 
         # --- Voice / Audio: download + transcribe ---
         elif message.voice or message.audio:
@@ -720,15 +741,11 @@ class TelegramChannel(BaseChannel):
                 or message.reply_to_message.caption
                 or ""
             )
-            if message.reply_to_message.photo and self._app:
+            if message.reply_to_message.photo:
+                # Lazy: the agent loop fetches it only if it can store it
                 reply_photo = message.reply_to_message.photo[-1]
-                try:
-                    file = await self._app.bot.get_file(reply_photo.file_id)
-                    data = await file.download_as_bytearray()
-                    reply_data["photo_data"] = bytes(data)
-                    reply_data["photo_mime"] = "image/jpeg"
-                except Exception as e:
-                    logger.error(f"Failed to download reply photo: {e}")
+                reply_data["photo_file_id"] = reply_photo.file_id
+                reply_data["photo_mime"] = "image/jpeg"
             reply_voice = (
                 message.reply_to_message.voice or message.reply_to_message.audio
             )
@@ -766,8 +783,6 @@ class TelegramChannel(BaseChannel):
 
         Returns (content_string, media_path_or_None).
         """
-        from pathlib import Path
-
         try:
             file = await self._app.bot.get_file(media_file.file_id)
             ext = self._get_extension(media_type, getattr(media_file, "mime_type", None))
@@ -783,6 +798,18 @@ class TelegramChannel(BaseChannel):
         if not self._transcriber:
             return f"[{media_type}: {file_path}]", str(file_path)
 
+        # Backpressure: don't let voice messages pile up behind the semaphore
+        if self._transcription_pending >= TRANSCRIPTION_QUEUE_LIMIT:
+            logger.warning(
+                f"Transcription queue full ({self._transcription_pending}), "
+                f"skipping {media_type}"
+            )
+            return (
+                "[Voice message — transcription failed: server busy, try again later]",
+                str(file_path),
+            )
+
+        self._transcription_pending += 1
         try:
             async with self._transcription_semaphore:
                 text = await self._transcriber.transcribe(file_path)
@@ -794,6 +821,13 @@ class TelegramChannel(BaseChannel):
                 f"[Voice message — transcription failed: {e.short_message}]",
                 str(file_path),
             )
+        finally:
+            self._transcription_pending -= 1
+
+    @property
+    def transcription_queue_depth(self) -> int:
+        """Number of transcriptions currently running or waiting."""
+        return self._transcription_pending
 
     def _get_extension(self, media_type: str, mime_type: str | None) -> str:
         """Get file extension based on media type."""
@@ -1,10 +1,12 @@
 """Web channel — browser-based chat via WebSocket."""
 
+import asyncio
+import gzip
 import json
 from pathlib import Path
 from typing import Any
 
-from aiohttp import web
+from aiohttp import WSMsgType, web
 from aiohttp.web import WebSocketResponse
 from loguru import logger
 
@@ -12,8 +14,33 @@ from ragnarbot.bus.events import OutboundMessage
 from ragnarbot.bus.queue import MessageBus
 from ragnarbot.channels.base import BaseChannel
 from ragnarbot.config.schema import WebConfig
+from ragnarbot.utils.helpers import ensure_dir, get_data_path
 
 STATIC_DIR = Path(__file__).parent / "web_static"
+WS_HEARTBEAT_SECONDS = 25.0
+
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _encode(data: dict) -> str:
+        """Serialize an outbound frame compactly."""
+        return orjson.dumps(data).decode()
+
+except ImportError:  # optional fast JSON; stdlib fallback
+    _loads = json.loads
+
+    def _encode(data: dict) -> str:
+        """Serialize an outbound frame compactly."""
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+# Constant frames, encoded once.
+_TYPING_ON = _encode({"type": "typing", "active": True})
+_TYPING_OFF = _encode({"type": "typing", "active": False})
+_PONG = _encode({"type": "pong"})
 
 
 class WebChannel(BaseChannel):
@@ -26,6 +53,17 @@ class WebChannel(BaseChannel):
         self._connections: dict[str, WebSocketResponse] = {}
         self._app: web.Application | None = None
         self._runner: web.AppRunner | None = None
+        self._index_path: Path | None = None
+        self._stop_event = asyncio.Event()
+        self._frame_handlers = {
+            "hello": self._on_hello,
+            "message": self._on_message,
+            "command": self._on_command,
+            "ping": self._on_ping,
+        }
+        self._command_handlers = {
+            "new_chat": self._cmd_new_chat,
+        }
 
     # ------------------------------------------------------------------
     # Auth
@@ -40,6 +78,8 @@ class WebChannel(BaseChannel):
     # ------------------------------------------------------------------
 
     async def start(self) -> None:
+        self._stop_event.clear()
+        self._index_path = self._render_index()
         self._app = web.Application()
         self._app.router.add_get("/", self._handle_index)
         self._app.router.add_get("/ws", self._handle_websocket)
@@ -60,19 +100,21 @@ class WebChannel(BaseChannel):
             self.config.port,
         )
 
-        # Block forever so ChannelManager.start_all keeps this task alive.
-        import asyncio
+        # Block until stop() so ChannelManager.start_all keeps this task alive.
         try:
-            await asyncio.Event().wait()
+            await self._stop_event.wait()
         except asyncio.CancelledError:
             pass
 
     async def stop(self) -> None:
         self._running = False
+        self._stop_event.set()
 
-        # Close every open WS connection.
-        for ws in list(self._connections.values()):
-            await ws.close()
+        # Close every open WS connection concurrently.
+        await asyncio.gather(
+            *(ws.close() for ws in self._connections.values()),
+            return_exceptions=True,
+        )
         self._connections.clear()
 
         if self._runner:
@@ -87,21 +129,30 @@ class WebChannel(BaseChannel):
 
     async def send(self, msg: OutboundMessage) -> None:
         ws = self._connections.get(msg.chat_id)
-        if not ws or ws.closed:
+        if not ws:
             return
 
-        # Typing indicator
-        if msg.metadata.get("chat_action") == "typing":
-            await self._ws_send(ws, {"type": "typing", "active": True})
-            return
+        try:
+            await self._deliver(ws, msg)
+        except ConnectionResetError:
+            # Socket died between heartbeats; drop it until the client re-hellos.
+            self._forget(msg.chat_id, ws)
 
-        is_intermediate = msg.metadata.get("intermediate", False)
+    async def _deliver(self, ws: WebSocketResponse, msg: OutboundMessage) -> None:
+        meta = msg.metadata
 
-        # Skip web-irrelevant metadata silently.
-        if msg.metadata.get("reaction"):
-            return
-        if msg.metadata.get("media_type"):
-            return
+        # Plain replies carry no special keys; only probe them when present.
+        if meta:
+            # Typing indicator
+            if meta.get("chat_action") == "typing":
+                await ws.send_str(_TYPING_ON)
+                return
+
+            # Skip web-irrelevant metadata silently.
+            if meta.get("reaction") or meta.get("media_type"):
+                return
+
+        is_intermediate = meta.get("intermediate", False)
 
         # Send the message.
         payload: dict[str, Any] = {
@@ -114,73 +165,129 @@ class WebChannel(BaseChannel):
         await self._ws_send(ws, payload)
 
         # Final message → stop typing.
-        if not is_intermediate and not msg.metadata.get("keep_typing"):
-            await self._ws_send(ws, {"type": "typing", "active": False})
+        if not is_intermediate and not meta.get("keep_typing"):
+            await ws.send_str(_TYPING_OFF)
 
     # ------------------------------------------------------------------
     # HTTP handlers
     # ------------------------------------------------------------------
 
-    async def _handle_index(self, _request: web.Request) -> web.Response:
+    def _render_index(self) -> Path:
+        """Template index.html once and write it where FileResponse can serve it.
+
+        A gzip sibling is written too; FileResponse serves ``index.html.gz``
+        automatically to clients that accept gzip.
+        """
         html = (STATIC_DIR / "index.html").read_text()
-        html = html.replace("{{title}}", self.config.title)
-        return web.Response(text=html, content_type="text/html")
+        body = html.replace("{{title}}", self.config.title).encode()
+        path = ensure_dir(get_data_path() / "web") / "index.html"
+        path.write_bytes(body)
+        path.with_name("index.html.gz").write_bytes(gzip.compress(body, compresslevel=9))
+        return path
+
+    async def _handle_index(self, _request: web.Request) -> web.FileResponse:
+        # Revalidate on every load (cheap 304 via ETag) so a restart with a new
+        # title or UI is picked up without a hard refresh.
+        return web.FileResponse(self._index_path, headers={"Cache-Control": "no-cache"})
 
     async def _handle_websocket(self, request: web.Request) -> WebSocketResponse:
-        ws = WebSocketResponse()
+        # Protocol-level pings; aiohttp closes the socket if no pong comes back,
+        # which ends the receive loop below and prunes the connection.
+        ws = WebSocketResponse(heartbeat=WS_HEARTBEAT_SECONDS)
         await ws.prepare(request)
 
         chat_id: str | None = None
+        text, binary, error = WSMsgType.TEXT, WSMsgType.BINARY, WSMsgType.ERROR
 
-        async for raw in ws:
-            if raw.type.name == "TEXT":
-                try:
-                    data = json.loads(raw.data)
-                except json.JSONDecodeError:
-                    await self._ws_send(ws, {"type": "error", "content": "Invalid JSON"})
-                    continue
-
-                msg_type = data.get("type")
-
-                if msg_type == "hello":
-                    chat_id = data.get("chat_id", "")
-                    if chat_id:
-                        self._connections[chat_id] = ws
-                        await self._ws_send(ws, {"type": "hello", "chat_id": chat_id})
-                        logger.debug("Web client connected: {}", chat_id[:8])
-
-                elif msg_type == "message":
-                    content = data.get("content", "").strip()
-                    if chat_id and content:
-                        await self._handle_message(
-                            sender_id=chat_id,
-                            chat_id=chat_id,
-                            content=content,
-                        )
-
-                elif msg_type == "command":
-                    command = data.get("command")
-                    if chat_id and command == "new_chat":
-                        # Remove old mapping; client will re-hello with a new chat_id.
-                        self._connections.pop(chat_id, None)
-                        chat_id = None
-
-            elif raw.type.name == "ERROR":
-                logger.warning("WS error: {}", ws.exception())
-                break
-
-        # Cleanup on disconnect.
-        if chat_id:
-            self._connections.pop(chat_id, None)
-            logger.debug("Web client disconnected: {}", chat_id[:8])
+        try:
+            async for raw in ws:
+                if raw.type is text or raw.type is binary:
+                    try:
+                        data = _loads(raw.data)
+                    except ValueError:
+                        # JSONDecodeError (stdlib or orjson) and UnicodeDecodeError
+                        # from non-UTF-8 binary frames are all ValueErrors.
+                        await self._ws_send(ws, {"type": "error", "content": "Invalid JSON"})
+                        continue
+                    if not isinstance(data, dict):
+                        await self._ws_send(ws, {"type": "error", "content": "Invalid frame"})
+                        continue
+
+                    handler = self._frame_handlers.get(data.get("type"))
+                    if handler:
+                        chat_id = await handler(ws, data, chat_id)
+
+                elif raw.type is error:
+                    logger.warning("WS error: {}", ws.exception())
+                    break
+        except ConnectionResetError:
+            pass
+        finally:
+            # Cleanup on any exit path (close, error, reset, cancellation).
+            if chat_id:
+                self._forget(chat_id, ws)
+                logger.debug("Web client disconnected: {}", chat_id[:8])
 
         return ws
 
+    # ------------------------------------------------------------------
+    # Inbound frames — each handler returns the connection's chat_id
+    # ------------------------------------------------------------------
+
+    async def _on_hello(
+        self, ws: WebSocketResponse, data: dict, chat_id: str | None
+    ) -> str | None:
+        chat_id = data.get("chat_id", "")
+        if chat_id:
+            self._connections[chat_id] = ws
+            await self._ws_send(ws, {"type": "hello", "chat_id": chat_id})
+            logger.debug("Web client connected: {}", chat_id[:8])
+        return chat_id
+
+    async def _on_message(
+        self, ws: WebSocketResponse, data: dict, chat_id: str | None
+    ) -> str | None:
+        content = data.get("content", "").strip()
+        if chat_id and content:
+            await self._handle_message(
+                sender_id=chat_id,
+                chat_id=chat_id,
+                content=content,
+            )
+        return chat_id
+
+    async def _on_ping(
+        self, ws: WebSocketResponse, data: dict, chat_id: str | None
+    ) -> str | None:
+        await ws.send_str(_PONG)
+        return chat_id
+
+    async def _on_command(
+        self, ws: WebSocketResponse, data: dict, chat_id: str | None
+    ) -> str | None:
+        handler = self._command_handlers.get(data.get("command"))
+        if chat_id and handler:
+            return await handler(ws, data, chat_id)
+        return chat_id
+
+    async def _cmd_new_chat(
+        self, ws: WebSocketResponse, data: dict, chat_id: str
+    ) -> str | None:
+        # Remove old mapping; client will re-hello with a new chat_id.
+        self._connections.pop(chat_id, None)
+        return None
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    def _forget(self, chat_id: str, ws: WebSocketResponse) -> None:
+        """Drop chat_id's mapping unless a newer socket has re-registered it."""
+        if self._connections.get(chat_id) is ws:
+            del self._connections[chat_id]
+
     @staticmethod
     async def _ws_send(ws: WebSocketResponse, data: dict) -> None:
-        if not ws.closed:
-            await ws.send_json(data)
+        # Closed sockets are pruned on disconnect; a send racing a close raises
+        # ConnectionResetError, which callers handle.
+        await ws.send_str(_encode(data))
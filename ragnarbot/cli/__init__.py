@@ -1 +1,20 @@
 """CLI module for ragnarbot."""
+
+import sys
+
+
+def main() -> None:
+    """Console entry point.
+
+    Answers a bare ``--version`` before importing Typer, Rich and the command
+    tree; everything else is handed to the Typer app.
+    """
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        from ragnarbot import __logo__, __version__
+
+        print(f"{__logo__} ragnarbot v{__version__}")
+        return
+
+    from ragnarbot.cli.commands import app
+
+    app()
@@ -1,12 +1,13 @@
 """CLI commands for ragnarbot."""
 
-import asyncio
+import functools
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.table import Table
+from rich.text import Text
 
 from ragnarbot import __logo__, __version__
 
@@ -18,15 +19,26 @@ app = typer.Typer(
 
 console = Console()
 
+# Reused table cells (plain Text skips Rich's markup parser).
+_STATUS_ENABLED = Text("enabled", style="green")
+_STATUS_DISABLED = Text("disabled", style="dim")
+_NOT_CONFIGURED = Text("not configured", style="dim")
 
-def _resolve_provider_auth(config, creds):
-    """Resolve API key and OAuth token from credentials for the active provider.
 
-    Returns (api_key, oauth_token, provider_name).
-    """
-    model = config.agents.defaults.model
-    provider_name = model.split("/")[0] if "/" in model else "anthropic"
-    auth_method = config.agents.defaults.auth_method
+@dataclass(frozen=True, slots=True)
+class AuthResolution:
+    """Provider credentials and model resolved for the active agent config."""
+    api_key: str | None
+    oauth_token: str | None
+    provider_name: str
+    model: str
+
+
+def _resolve_provider_auth(config, creds) -> AuthResolution:
+    """Resolve API key and OAuth token from credentials for the active provider."""
+    defaults = config.agents.defaults
+    provider_name = defaults.provider_name
+    auth_method = defaults.auth_method
 
     provider_creds = getattr(creds.providers, provider_name, None)
     oauth_token = None
@@ -38,7 +50,33 @@ def _resolve_provider_auth(config, creds):
         elif provider_creds.api_key:
             api_key = provider_creds.api_key
 
-    return api_key, oauth_token, provider_name
+    return AuthResolution(api_key, oauth_token, provider_name, defaults.model)
+
+
+def _anthropic_oauth_provider(auth: AuthResolution):
+    from ragnarbot.providers.anthropic_provider import AnthropicProvider
+
+    return AnthropicProvider(oauth_token=auth.oauth_token, default_model=auth.model)
+
+
+def _litellm_provider(auth: AuthResolution):
+    from ragnarbot.providers.litellm_provider import LiteLLMProvider
+
+    return LiteLLMProvider(api_key=auth.api_key, default_model=auth.model)
+
+
+# (provider, auth method) -> factory; each factory imports only its own provider.
+# Anything not listed goes through LiteLLM with an API key.
+_PROVIDER_FACTORIES = {
+    ("anthropic", "oauth"): _anthropic_oauth_provider,
+}
+
+
+def _create_provider(auth: AuthResolution):
+    """Build the LLM provider for the resolved auth."""
+    auth_method = "oauth" if auth.oauth_token else "api_key"
+    factory = _PROVIDER_FACTORIES.get((auth.provider_name, auth_method), _litellm_provider)
+    return factory(auth)
 
 
 def _validate_auth(config, creds):
@@ -48,8 +86,7 @@ def _validate_auth(config, creds):
     """
     from ragnarbot.config.schema import OAUTH_SUPPORTED_PROVIDERS
 
-    model = config.agents.defaults.model
-    provider_name = model.split("/")[0] if "/" in model else "anthropic"
+    provider_name = config.agents.defaults.provider_name
     auth_method = config.agents.defaults.auth_method
 
     if auth_method not in ("api_key", "oauth"):
@@ -74,6 +111,19 @@ def _validate_auth(config, creds):
     return None
 
 
+def _run_async(main):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
+
+
 def version_callback(value: bool):
     if value:
         console.print(f"{__logo__} ragnarbot v{__version__}")
@@ -133,22 +183,6 @@ def bootstrap():
         raise typer.Exit(1)
 
 
-def _create_workspace_templates(workspace: Path):
-    """Copy default workspace files from workspace_defaults/ if missing."""
-    import shutil
-    from ragnarbot.agent.context import DEFAULTS_DIR
-
-    for default_file in DEFAULTS_DIR.rglob("*"):
-        if not default_file.is_file():
-            continue
-        rel = default_file.relative_to(DEFAULTS_DIR)
-        target = workspace / rel
-        if not target.exists():
-            target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(default_file, target)
-            console.print(f"  [dim]Created {rel}[/dim]")
-
-
 # ============================================================================
 # Gateway / Server
 # ============================================================================
@@ -166,16 +200,10 @@ def gateway_main(
     """Start the ragnarbot gateway. Use subcommands to manage the daemon."""
     if ctx.invoked_subcommand is not None:
         return
-    from ragnarbot.agent.loop import AgentLoop
+    import asyncio
+
     from ragnarbot.auth.credentials import load_credentials
-    from ragnarbot.bus.queue import MessageBus
-    from ragnarbot.channels.manager import ChannelManager
     from ragnarbot.config.loader import get_data_dir, load_config
-    from ragnarbot.cron.service import CronService
-    from ragnarbot.cron.types import CronJob
-    from ragnarbot.heartbeat.service import HeartbeatService
-    from ragnarbot.media.manager import MediaManager
-    from ragnarbot.providers.litellm_provider import LiteLLMProvider
 
     if verbose:
         import logging
@@ -190,28 +218,26 @@ def gateway_main(
     config = load_config()
     creds = load_credentials()
 
-    # Create components
-    bus = MessageBus()
-
-    # Validate auth configuration
+    # Validate auth configuration before importing the agent/provider stack,
+    # so a misconfigured gateway fails fast without loading litellm.
     error = _validate_auth(config, creds)
     if error:
         console.print(f"[red]Error: {error}[/red]")
         raise typer.Exit(1)
 
-    api_key, oauth_token, provider_name = _resolve_provider_auth(config, creds)
+    from ragnarbot.agent.loop import AgentLoop
+    from ragnarbot.bus.queue import MessageBus
+    from ragnarbot.channels.manager import ChannelManager
+    from ragnarbot.cron.service import CronService
+    from ragnarbot.cron.types import CronJob
+    from ragnarbot.heartbeat.service import HeartbeatService
+    from ragnarbot.media.manager import MediaManager
 
-    if provider_name == "anthropic" and oauth_token:
-        from ragnarbot.providers.anthropic_provider import AnthropicProvider
-        provider = AnthropicProvider(
-            oauth_token=oauth_token,
-            default_model=config.agents.defaults.model,
-        )
-    else:
-        provider = LiteLLMProvider(
-            api_key=api_key,
-            default_model=config.agents.defaults.model,
-        )
+    # Create components
+    bus = MessageBus()
+
+    auth = _resolve_provider_auth(config, creds)
+    provider = _create_provider(auth)
 
     # Service credentials
     brave_api_key = creds.services.brave_search.api_key or None
@@ -230,7 +256,7 @@ def gateway_main(
         bus=bus,
         provider=provider,
         workspace=config.workspace_path,
-        model=config.agents.defaults.model,
+        model=auth.model,
         brave_api_key=brave_api_key,
         exec_config=config.tools.exec,
         cron_service=cron,
@@ -315,24 +341,31 @@ def gateway_main(
                 except Exception as e:
                     console.print(f"[red]Config reload failed: {e}[/red]")
 
-        try:
-            await cron.start()
-            await heartbeat.start()
-            await asyncio.gather(
-                agent.run(),
-                channels.start_all(),
-                _config_reloader(),
-            )
-        except KeyboardInterrupt:
+        async def _shutdown():
             console.print("\nShutting down...")
             heartbeat.stop()
             cron.stop()
             agent.stop()
             await channels.stop_all()
+
+        try:
+            await cron.start()
+            await heartbeat.start()
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(agent.run())
+                tg.create_task(channels.start_all())
+                tg.create_task(_config_reloader())
+        except KeyboardInterrupt:
+            await _shutdown()
+        except asyncio.CancelledError:
+            # Ctrl+C under asyncio.Runner arrives as cancellation; the task
+            # group has already cancelled its children, so just clean up.
+            await _shutdown()
+            raise
         finally:
             pid_path.unlink(missing_ok=True)
 
-    asyncio.run(run())
+    _run_async(run())
 
 
 @gateway_app.command("start")
@@ -357,7 +390,7 @@ def gateway_start():
             console.print(f"[green]Gateway is already running[/green] (PID {info.pid})")
             return
 
-        if not manager.is_installed():
+        if info.status == DaemonStatus.NOT_INSTALLED:
             manager.install()
             console.print("[green]Daemon installed[/green]")
 
@@ -380,12 +413,11 @@ def gateway_stop():
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1)
 
-    if not manager.is_installed():
-        console.print("[yellow]Daemon is not installed[/yellow]")
-        raise typer.Exit(1)
-
     try:
         info = manager.status()
+        if info.status == DaemonStatus.NOT_INSTALLED:
+            console.print("[yellow]Daemon is not installed[/yellow]")
+            raise typer.Exit(1)
         if info.status != DaemonStatus.RUNNING:
             console.print("[yellow]Gateway is not running[/yellow]")
             return
@@ -437,12 +469,11 @@ def gateway_delete():
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1)
 
-    if not manager.is_installed():
-        console.print("[yellow]Daemon is not installed[/yellow]")
-        raise typer.Exit(1)
-
     try:
         info = manager.status()
+        if info.status == DaemonStatus.NOT_INSTALLED:
+            console.print("[yellow]Daemon is not installed[/yellow]")
+            raise typer.Exit(1)
         if info.status == DaemonStatus.RUNNING:
             manager.stop()
             console.print("[green]Gateway stopped[/green]")
@@ -525,8 +556,6 @@ def telegram_grant_access(
     # Send confirmation to user via Telegram
     bot_token = creds.channels.telegram.bot_token
     if bot_token:
-        import asyncio
-
         async def _send_confirmation():
             from telegram import Bot
 
@@ -544,7 +573,7 @@ def telegram_grant_access(
                 await set_bot_commands(bot)
 
         try:
-            asyncio.run(_send_confirmation())
+            _run_async(_send_confirmation())
         except Exception as e:
             console.print(f"[yellow]Warning: Could not send confirmation via Telegram: {e}[/yellow]")
     else:
@@ -586,6 +615,8 @@ app.add_typer(channels_app, name="channels")
 @channels_app.command("status")
 def channels_status():
     """Show channel status."""
+    from rich.table import Table
+
     from ragnarbot.auth.credentials import load_credentials
     from ragnarbot.config.loader import load_config
 
@@ -597,10 +628,13 @@ def channels_status():
     table.add_column("Enabled", style="green")
     table.add_column("Configuration", style="yellow")
 
+    channels = config.channels
+    channel_creds = creds.channels
+
     # Telegram
-    tg = config.channels.telegram
-    tg_token = creds.channels.telegram.bot_token
-    tg_config = f"token: {tg_token[:10]}..." if tg_token else "[dim]not configured[/dim]"
+    tg = channels.telegram
+    tg_token = channel_creds.telegram.bot_token
+    tg_config = f"token: {tg_token[:10]}..." if tg_token else _NOT_CONFIGURED
     table.add_row(
         "Telegram",
         "✓" if tg.enabled else "✗",
@@ -608,8 +642,8 @@ def channels_status():
     )
 
     # Web
-    web_cfg = config.channels.web
-    web_info = f"http://{web_cfg.host}:{web_cfg.port}" if web_cfg.enabled else "[dim]not configured[/dim]"
+    web_cfg = channels.web
+    web_info = f"http://{web_cfg.host}:{web_cfg.port}" if web_cfg.enabled else _NOT_CONFIGURED
     table.add_row("Web", "✓" if web_cfg.enabled else "✗", web_info)
 
     console.print(table)
@@ -624,16 +658,21 @@ cron_app = typer.Typer(help="Manage scheduled tasks")
 app.add_typer(cron_app, name="cron")
 
 
+@functools.cache
+def _cron_service():
+    """The CronService backing the CLI's jobs.json, built once per process."""
+    from ragnarbot.config.loader import get_data_dir
+    from ragnarbot.cron.service import CronService
+
+    return CronService(get_data_dir() / "cron" / "jobs.json")
+
+
 @cron_app.command("list")
 def cron_list(
     all: bool = typer.Option(False, "--all", "-a", help="Include disabled jobs"),
 ):
     """List scheduled jobs."""
-    from ragnarbot.config.loader import get_data_dir
-    from ragnarbot.cron.service import CronService
-
-    store_path = get_data_dir() / "cron" / "jobs.json"
-    service = CronService(store_path)
+    service = _cron_service()
 
     jobs = service.list_jobs(include_disabled=all)
 
@@ -641,6 +680,8 @@ def cron_list(
         console.print("No scheduled jobs.")
         return
 
+    from rich.table import Table
+
     table = Table(title="Scheduled Jobs")
     table.add_column("ID", style="cyan")
     table.add_column("Name")
@@ -649,6 +690,9 @@ def cron_list(
     table.add_column("Next Run")
 
     import time
+
+    strftime, localtime = time.strftime, time.localtime
+    next_run_labels: dict[int, str] = {}  # minute -> formatted label; jobs often share one
     for job in jobs:
         # Format schedule
         if job.schedule.kind == "every":
@@ -661,10 +705,13 @@ def cron_list(
         # Format next run
         next_run = ""
         if job.state.next_run_at_ms:
-            next_time = time.strftime("%Y-%m-%d %H:%M", time.localtime(job.state.next_run_at_ms / 1000))
-            next_run = next_time
+            minute = job.state.next_run_at_ms // 60000
+            next_run = next_run_labels.get(minute)
+            if next_run is None:
+                next_run = strftime("%Y-%m-%d %H:%M", localtime(minute * 60))
+                next_run_labels[minute] = next_run
 
-        status = "[green]enabled[/green]" if job.enabled else "[dim]disabled[/dim]"
+        status = _STATUS_ENABLED if job.enabled else _STATUS_DISABLED
 
         table.add_row(job.id, job.name, sched, status, next_run)
 
@@ -683,8 +730,6 @@ def cron_add(
     channel: str = typer.Option(None, "--channel", help="Channel for delivery (e.g. 'telegram')"),
 ):
     """Add a scheduled job."""
-    from ragnarbot.config.loader import get_data_dir
-    from ragnarbot.cron.service import CronService
     from ragnarbot.cron.types import CronSchedule
 
     # Determine schedule type
@@ -700,10 +745,7 @@ def cron_add(
         console.print("[red]Error: Must specify --every, --cron, or --at[/red]")
         raise typer.Exit(1)
 
-    store_path = get_data_dir() / "cron" / "jobs.json"
-    service = CronService(store_path)
-
-    job = service.add_job(
+    job = _cron_service().add_job(
         name=name,
         schedule=schedule,
         message=message,
@@ -720,11 +762,7 @@ def cron_remove(
     job_id: str = typer.Argument(..., help="Job ID to remove"),
 ):
     """Remove a scheduled job."""
-    from ragnarbot.config.loader import get_data_dir
-    from ragnarbot.cron.service import CronService
-
-    store_path = get_data_dir() / "cron" / "jobs.json"
-    service = CronService(store_path)
+    service = _cron_service()
 
     if service.remove_job(job_id):
         console.print(f"[green]✓[/green] Removed job {job_id}")
@@ -738,11 +776,7 @@ def cron_enable(
     disable: bool = typer.Option(False, "--disable", help="Disable instead of enable"),
 ):
     """Enable or disable a job."""
-    from ragnarbot.config.loader import get_data_dir
-    from ragnarbot.cron.service import CronService
-
-    store_path = get_data_dir() / "cron" / "jobs.json"
-    service = CronService(store_path)
+    service = _cron_service()
 
     job = service.enable_job(job_id, enabled=not disable)
     if job:
@@ -758,16 +792,9 @@ def cron_run(
     force: bool = typer.Option(False, "--force", "-f", help="Run even if disabled"),
 ):
     """Manually run a job."""
-    from ragnarbot.config.loader import get_data_dir
-    from ragnarbot.cron.service import CronService
-
-    store_path = get_data_dir() / "cron" / "jobs.json"
-    service = CronService(store_path)
+    service = _cron_service()
 
-    async def run():
-        return await service.run_job(job_id, force=force)
-
-    if asyncio.run(run()):
+    if _run_async(service.run_job(job_id, force=force)):
         console.print("[green]✓[/green] Job executed")
     else:
         console.print(f"[red]Failed to run job {job_id}[/red]")
@@ -802,11 +829,7 @@ def status():
         console.print(f"Model: {config.agents.defaults.model}")
 
         auth_method = config.agents.defaults.auth_method
-        provider_name = (
-            config.agents.defaults.model.split("/")[0]
-            if "/" in config.agents.defaults.model
-            else "anthropic"
-        )
+        provider_name = config.agents.defaults.provider_name
 
         for name in ("anthropic", "openai", "gemini"):
             pc = getattr(creds.providers, name)
@@ -1,5 +1,9 @@
 """TUI onboarding wizard for ragnarbot."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
 from rich.console import Console
 
 from ragnarbot.cli.tui.components import QuitOnboardingError, clear_screen
@@ -29,10 +33,23 @@ def run_onboarding(console: Console) -> None:
         console.print("\n  Setup cancelled.\n")
 
 
-def _onboarding_loop(console: Console) -> None:
-    """Main onboarding state machine with back navigation."""
-    # State
+def _prewarm() -> None:
+    """Import the modules _save_results needs while the user is on the first screens."""
+    try:
+        import ragnarbot.auth.credentials  # noqa: F401
+        import ragnarbot.config.loader  # noqa: F401
+        import ragnarbot.daemon  # noqa: F401
+        import ragnarbot.utils.workspace  # noqa: F401
+    except Exception:
+        # _save_results imports these again and reports any failure itself
+        pass
+
+
+@dataclass
+class OnboardingState:
+    """Answers collected so far by the onboarding wizard."""
     provider_idx: int | None = None
+    provider_id: str = ""  # resolved once per provider choice
     auth_idx: int | None = None
     token: str | None = None
     model_idx: int | None = None
@@ -42,115 +59,144 @@ def _onboarding_loop(console: Console) -> None:
     web_search_key: str = ""
     enable_daemon: bool | None = None
 
-    step = 1  # 1=provider, 2=auth, 3=token, 4=model, 5=telegram, 6=voice, 7=web_search, 8=daemon, 9=summary
-
-    while True:
-        if step == 1:
-            provider_idx = provider_screen(console)
-            if provider_idx is None:
-                # Quit from first screen
-                raise QuitOnboardingError()
-            step = 2
-
-        elif step == 2:
-            provider_id = PROVIDERS[provider_idx]["id"]
-            if supports_oauth(provider_id):
-                auth_idx = auth_method_screen(console, provider_id)
-                if auth_idx is None:
-                    step = 1
-                    continue
-            else:
-                auth_idx = 1  # api_key
-            step = 3
-
-        elif step == 3:
-            provider_id = PROVIDERS[provider_idx]["id"]
-            auth_method = "oauth" if auth_idx == 0 else "api_key"
-            token = token_input_screen(console, provider_id, auth_method)
-            if token is None:
-                # Go back to auth or provider
-                if supports_oauth(provider_id):
-                    step = 2
-                else:
-                    step = 1
-                continue
-            step = 4
-
-        elif step == 4:
-            provider_id = PROVIDERS[provider_idx]["id"]
-            model_idx = model_screen(console, provider_id)
-            if model_idx is None:
-                step = 3
-                continue
-            step = 5
-
-        elif step == 5:
-            telegram_token = telegram_screen(console)
-            if telegram_token is None:
-                step = 4
-                continue
-            step = 6
-
-        elif step == 6:
-            result = voice_transcription_screen(console)
-            if result is None:
-                step = 5
-                continue
-            voice_provider, voice_api_key = result
-            step = 7
-
-        elif step == 7:
-            web_search_key_result = web_search_screen(console)
-            if web_search_key_result is None:
-                step = 6
-                continue
-            web_search_key = web_search_key_result
-            step = 8
-
-        elif step == 8:
-            daemon_idx = daemon_screen(console)
-            if daemon_idx is None:
-                step = 7
-                continue
-            enable_daemon = daemon_idx == 0
-            step = 9
-
-        elif step == 9:
-            provider_id = PROVIDERS[provider_idx]["id"]
-            provider = get_provider(provider_id)
-            auth_method = "oauth" if auth_idx == 0 else "api_key"
-            models = get_models(provider_id)
-            model = models[model_idx]
-            telegram_configured = bool(telegram_token)
-
-            ok = summary_screen(
-                console,
-                provider["name"],
-                auth_method,
-                model["name"],
-                telegram_configured,
-                enable_daemon=enable_daemon,
-                voice_provider=voice_provider,
-                web_search_configured=bool(web_search_key),
-            )
-            if not ok:
-                step = 8
-                continue
-
-            # Save everything
-            _save_results(
-                console=console,
-                provider_id=provider_id,
-                auth_method=auth_method,
-                token=token,
-                model_id=model["id"],
-                telegram_token=telegram_token if telegram_configured else "",
-                enable_daemon=enable_daemon,
-                voice_provider=voice_provider,
-                voice_api_key=voice_api_key,
-                web_search_key=web_search_key,
-            )
-            return
+    @property
+    def auth_method(self) -> str:
+        return "oauth" if self.auth_idx == 0 else "api_key"
+
+
+# Each step shows its screen, records the answer, and returns the next step
+# number (0 when the wizard is finished), or None to go back to the previous
+# screen the user saw.
+
+def _step_provider(console: Console, state: OnboardingState) -> int | None:
+    provider_idx = provider_screen(console)
+    if provider_idx is None:
+        # Quit from first screen
+        raise QuitOnboardingError()
+    state.provider_idx = provider_idx
+    state.provider_id = PROVIDERS[provider_idx]["id"]
+    if supports_oauth(state.provider_id):
+        return 2
+    state.auth_idx = 1  # api_key; no auth method to choose
+    return 3
+
+
+def _step_auth(console: Console, state: OnboardingState) -> int | None:
+    state.auth_idx = auth_method_screen(console, state.provider_id)
+    if state.auth_idx is None:
+        return None
+    return 3
+
+
+def _step_token(console: Console, state: OnboardingState) -> int | None:
+    state.token = token_input_screen(console, state.provider_id, state.auth_method)
+    if state.token is None:
+        return None
+    return 4
+
+
+def _step_model(console: Console, state: OnboardingState) -> int | None:
+    state.model_idx = model_screen(console, state.provider_id)
+    if state.model_idx is None:
+        return None
+    return 5
+
+
+def _step_telegram(console: Console, state: OnboardingState) -> int | None:
+    state.telegram_token = telegram_screen(console)
+    if state.telegram_token is None:
+        return None
+    return 6
+
+
+def _step_voice(console: Console, state: OnboardingState) -> int | None:
+    result = voice_transcription_screen(console)
+    if result is None:
+        return None
+    state.voice_provider, state.voice_api_key = result
+    return 7
+
+
+def _step_web_search(console: Console, state: OnboardingState) -> int | None:
+    web_search_key = web_search_screen(console)
+    if web_search_key is None:
+        return None
+    state.web_search_key = web_search_key
+    return 8
+
+
+def _step_daemon(console: Console, state: OnboardingState) -> int | None:
+    daemon_idx = daemon_screen(console)
+    if daemon_idx is None:
+        return None
+    state.enable_daemon = daemon_idx == 0
+    return 9
+
+
+def _step_summary(console: Console, state: OnboardingState) -> int | None:
+    provider = get_provider(state.provider_id)
+    model = get_models(state.provider_id)[state.model_idx]
+    telegram_configured = bool(state.telegram_token)
+
+    ok = summary_screen(
+        console,
+        provider["name"],
+        state.auth_method,
+        model["name"],
+        telegram_configured,
+        enable_daemon=state.enable_daemon,
+        voice_provider=state.voice_provider,
+        web_search_configured=bool(state.web_search_key),
+    )
+    if not ok:
+        return None
+
+    # Save everything
+    _save_results(
+        console=console,
+        provider_id=state.provider_id,
+        auth_method=state.auth_method,
+        token=state.token,
+        model_id=model["id"],
+        telegram_token=state.telegram_token if telegram_configured else "",
+        enable_daemon=state.enable_daemon,
+        voice_provider=state.voice_provider,
+        voice_api_key=state.voice_api_key,
+        web_search_key=state.web_search_key,
+    )
+    return 0
+
+
+# Indexed by step number - 1:
+# 1=provider, 2=auth, 3=token, 4=model, 5=telegram, 6=voice, 7=web_search, 8=daemon, 9=summary
+_STEPS = (
+    _step_provider,
+    _step_auth,
+    _step_token,
+    _step_model,
+    _step_telegram,
+    _step_voice,
+    _step_web_search,
+    _step_daemon,
+    _step_summary,
+)
+
+
+def _onboarding_loop(console: Console) -> None:
+    """Main onboarding state machine with back navigation."""
+    state = OnboardingState()
+
+    threading.Thread(target=_prewarm, name="onboarding-prewarm", daemon=True).start()
+
+    history: list[int] = []  # steps the user moved forward from, for Esc
+    step = 1
+    while step:
+        next_step = _STEPS[step - 1](console, state)
+        if next_step is None:
+            step = history.pop()
+        else:
+            history.append(step)
+            step = next_step
 
 
 def _save_results(
@@ -192,8 +238,6 @@ def _save_results(
     # Update daemon
     config.daemon.enabled = enable_daemon
 
-    save_config(config)
-
     # Update credentials (targeted — only touch the selected provider)
     provider_creds = getattr(creds.providers, provider_id)
     if auth_method == "oauth":
@@ -210,14 +254,20 @@ def _save_results(
     if web_search_key:
         creds.services.brave_search.api_key = web_search_key
 
-    save_credentials(creds)
-
     # Ensure workspace exists
     workspace = get_workspace_path()
 
-    # Create workspace templates if needed
-    from ragnarbot.cli.commands import _create_workspace_templates
-    _create_workspace_templates(workspace)
+    from ragnarbot.utils.workspace import create_workspace_templates
+
+    # Config, credentials and workspace templates are separate files — write them together
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [
+            pool.submit(save_config, config),
+            pool.submit(save_credentials, creds),
+            pool.submit(create_workspace_templates, workspace, console),
+        ]
+    for future in futures:
+        future.result()
 
     # Install and start daemon if requested
     daemon_started = False
@@ -233,25 +283,33 @@ def _save_results(
             console.print("  [yellow]You can start it manually: ragnarbot gateway start[/yellow]")
 
     clear_screen(console)
-    console.print()
-    console.print("  [green]Configuration saved![/green]")
-    console.print()
-    console.print(f"  Config:      {get_config_path()}")
-    console.print(f"  Credentials: {get_credentials_path()}")
-    console.print(f"  Workspace:   {workspace}")
-    console.print()
+    lines = [
+        "",
+        "  [green]Configuration saved![/green]",
+        "",
+        f"  Config:      {get_config_path()}",
+        f"  Credentials: {get_credentials_path()}",
+        f"  Workspace:   {workspace}",
+        "",
+    ]
     if daemon_started:
-        console.print("  [green]Gateway is running![/green]")
-        console.print()
-        console.print("  [bold]Daemon commands:[/bold]")
-        console.print("  [cyan]ragnarbot gateway start[/cyan]    Install and start daemon")
-        console.print("  [cyan]ragnarbot gateway stop[/cyan]     Stop daemon")
-        console.print("  [cyan]ragnarbot gateway restart[/cyan]  Restart daemon")
-        console.print("  [cyan]ragnarbot gateway delete[/cyan]   Remove daemon from system")
-        console.print("  [cyan]ragnarbot gateway status[/cyan]   Show daemon status")
+        lines += [
+            "  [green]Gateway is running![/green]",
+            "",
+            "  [bold]Daemon commands:[/bold]",
+            "  [cyan]ragnarbot gateway start[/cyan]    Install and start daemon",
+            "  [cyan]ragnarbot gateway stop[/cyan]     Stop daemon",
+            "  [cyan]ragnarbot gateway restart[/cyan]  Restart daemon",
+            "  [cyan]ragnarbot gateway delete[/cyan]   Remove daemon from system",
+            "  [cyan]ragnarbot gateway status[/cyan]   Show daemon status",
+        ]
     else:
-        console.print("  [bold]Next steps:[/bold]")
-        console.print("  Chat: [cyan]ragnarbot agent -m \"Hello!\"[/cyan]")
-        console.print("  Start manually: [cyan]ragnarbot gateway[/cyan]")
-        console.print("  Enable daemon:  [cyan]ragnarbot gateway start[/cyan]")
-    console.print()
+        lines += [
+            "  [bold]Next steps:[/bold]",
+            "  Chat: [cyan]ragnarbot agent -m \"Hello!\"[/cyan]",
+            "  Start manually: [cyan]ragnarbot gateway[/cyan]",
+            "  Enable daemon:  [cyan]ragnarbot gateway start[/cyan]",
+        ]
+    lines.append("")
+    # One render and one terminal write for the whole summary
+    console.print("\n".join(lines))
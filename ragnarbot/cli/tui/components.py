@@ -1,9 +1,14 @@
 """Reusable TUI widgets for onboarding screens."""
 
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
 from rich.console import Console
+from rich.live import Live
+from rich.text import Text
 
 from ragnarbot import __logo__
-from ragnarbot.cli.tui.keys import Key, get_key_reader
+from ragnarbot.cli.tui.keys import Key, get_key_reader, has_buffered, raw_mode
 
 
 class QuitOnboardingError(Exception):
@@ -16,22 +21,51 @@ def clear_screen(console: Console) -> None:
     console.clear()
 
 
-def draw_header(console: Console, title: str, subtitle: str = "") -> None:
-    """Draw screen header with logo and title."""
-    clear_screen(console)
-    console.print()
-    console.print(f"  {__logo__} [bold]ragnarbot setup[/bold]", highlight=False)
-    console.print(f"  [dim]{'─' * 40}[/dim]")
-    console.print(f"  [bold cyan]{title}[/bold cyan]")
+# Header lines shared by every screen
+_BRAND = f"  {__logo__} [bold]ragnarbot setup[/bold]"
+_DIVIDER = f"  [dim]{'─' * 40}[/dim]"
+
+
+def render_header(title: str, subtitle: str = "") -> Text:
+    """Build the screen header (logo and title)."""
+    lines = ["", _BRAND, _DIVIDER, f"  [bold cyan]{title}[/bold cyan]"]
     if subtitle:
-        console.print(f"  [dim]{subtitle}[/dim]")
-    console.print()
+        lines.append(f"  [dim]{subtitle}[/dim]")
+    lines.append("")
+    return Text.from_markup("\n".join(lines))
+
+
+def render_footer(hints: str) -> Text:
+    """Build the navigation hints shown at the bottom."""
+    return Text.assemble("\n  ", (hints, "dim"))
+
+
+_NEWLINE = Text("\n")
+
+# Menu navigation keys -> change in the selected row
+_MENU_MOVES = {Key.UP: -1, Key.DOWN: 1}
+
+
+@contextmanager
+def live_screen(console: Console) -> Iterator[Callable[..., None]]:
+    """Show one screen, redrawing it in place on each frame.
+
+    Yields draw(*parts), which joins the Text parts into a frame. The
+    screen is cleared once on entry; after that Rich rewrites only the
+    screen's own lines instead of clearing the whole terminal per keypress.
+    """
+    clear_screen(console)
+    with Live(
+        console=console,
+        auto_refresh=False,
+        redirect_stdout=False,
+        redirect_stderr=False,
+    ) as live:
 
+        def draw(*parts: Text) -> None:
+            live.update(_NEWLINE.join(parts), refresh=True)
 
-def draw_footer(console: Console, hints: str) -> None:
-    """Draw navigation hints at the bottom."""
-    console.print()
-    console.print(f"  [dim]{hints}[/dim]")
+        yield draw
 
 
 def select_menu(
@@ -60,29 +94,35 @@ def select_menu(
     """
     read = get_key_reader()
 
-    while True:
-        draw_header(console, title, subtitle)
-
-        for i, (label, desc) in enumerate(options):
-            if i == selected:
-                console.print(f"  [bold cyan]▸ {label}[/bold cyan]  [dim]{desc}[/dim]")
-            else:
-                console.print(f"    {label}  [dim]{desc}[/dim]")
-
-        draw_footer(console, f"↑/↓ Navigate  Enter Select  Esc {back_label}  Q Quit")
-
-        key, char = read()
-
-        if key == Key.UP:
-            selected = (selected - 1) % len(options)
-        elif key == Key.DOWN:
-            selected = (selected + 1) % len(options)
-        elif key == Key.ENTER:
-            return selected
-        elif key == Key.ESC:
-            return None
-        elif key == Key.CHAR and char.lower() == "q":
-            raise QuitOnboardingError()
+    header = render_header(title, subtitle)
+    footer = render_footer(f"↑/↓ Navigate  Enter Select  Esc {back_label}  Q Quit")
+
+    # Both renderings of every row, built once; a frame just picks per row
+    plain_rows = [Text.assemble(f"    {label}  ", (desc, "dim")) for label, desc in options]
+    selected_rows = [
+        Text.assemble((f"  ▸ {label}", "bold cyan"), "  ", (desc, "dim"))
+        for label, desc in options
+    ]
+
+    with raw_mode(), live_screen(console) as draw:
+        while True:
+            # Keys typed ahead are applied without drawing the frames in between
+            if not has_buffered():
+                rows = plain_rows.copy()
+                rows[selected] = selected_rows[selected]
+                draw(header, _NEWLINE.join(rows), footer)
+
+            key, char = read()
+
+            move = _MENU_MOVES.get(key)
+            if move is not None:
+                selected = (selected + move) % len(options)
+            elif key == Key.ENTER:
+                return selected
+            elif key == Key.ESC:
+                return None
+            elif key == Key.CHAR and char in ("q", "Q"):
+                raise QuitOnboardingError()
 
 
 def text_input(
@@ -112,49 +152,52 @@ def text_input(
         QuitOnboardingError: If user pressed Q to quit (only when buffer empty)
     """
     read = get_key_reader()
-    buffer = ""
+    chars: list[str] = []  # typed characters; joined once per frame
     error = ""
 
-    while True:
-        draw_header(console, title, subtitle)
-
-        if hint:
-            console.print(f"  [dim]{hint}[/dim]")
-            console.print()
-
-        # Display the input
-        if secret and buffer:
-            visible = "•" * max(0, len(buffer) - 4) + buffer[-4:]
-        else:
-            visible = buffer
-
-        console.print(f"  {prompt}: {visible}[blink]_[/blink]")
-
-        if error:
-            console.print(f"\n  [red]{error}[/red]")
-            error = ""
-
-        skip_hint = "  Enter Skip" if allow_empty else ""
-        draw_footer(console, f"Type to enter  Esc Back  Q Quit{skip_hint}")
-
-        key, char = read()
-
-        if key == Key.BACKSPACE:
-            buffer = buffer[:-1]
-        elif key == Key.ENTER:
-            if buffer:
-                return buffer
-            elif allow_empty:
-                return ""
-            else:
-                error = "Input cannot be empty"
-        elif key == Key.ESC:
-            return None
-        elif key == Key.CHAR:
-            if char.lower() == "q" and not buffer:
-                raise QuitOnboardingError()
-            else:
-                buffer += char
+    header = render_header(title, subtitle)
+    if hint:
+        header = _NEWLINE.join([header, Text.from_markup(f"  [dim]{hint}[/dim]\n")])
+    skip_hint = "  Enter Skip" if allow_empty else ""
+    footer = render_footer(f"Type to enter  Esc Back  Q Quit{skip_hint}")
+
+    with raw_mode(), live_screen(console) as draw:
+        while True:
+            # Redraw once a paste has been consumed, not per pasted character
+            if not has_buffered():
+                buffer = "".join(chars)
+                if secret and buffer:
+                    visible = "•" * max(0, len(buffer) - 4) + buffer[-4:]
+                else:
+                    visible = buffer
+
+                body = Text.assemble(f"  {prompt}: ", visible, ("_", "blink"))
+                if error:
+                    body.append(f"\n\n  {error}", "red")
+                    error = ""
+
+                draw(header, body, footer)
+
+            key, char = read()
+
+            # Typed characters are by far the most common event; test them first
+            if key == Key.CHAR:
+                if not chars and char in ("q", "Q"):
+                    raise QuitOnboardingError()
+                else:
+                    chars.append(char)
+            elif key == Key.BACKSPACE:
+                if chars:
+                    chars.pop()
+            elif key == Key.ENTER:
+                if chars:
+                    return "".join(chars)
+                elif allow_empty:
+                    return ""
+                else:
+                    error = "Input cannot be empty"
+            elif key == Key.ESC:
+                return None
 
 
 def info_screen(
@@ -172,18 +215,18 @@ def info_screen(
     """
     read = get_key_reader()
 
-    draw_header(console, title, subtitle)
-
-    for line in lines:
-        console.print(f"  {line}")
-
-    draw_footer(console, "Enter Continue  Esc Back  Q Quit")
-
-    while True:
-        key, char = read()
-        if key == Key.ENTER:
-            return True
-        elif key == Key.ESC:
-            return False
-        elif key == Key.CHAR and char.lower() == "q":
-            raise QuitOnboardingError()
+    with raw_mode(), live_screen(console) as draw:
+        draw(
+            render_header(title, subtitle),
+            Text.from_markup("\n".join(f"  {line}" for line in lines)),
+            render_footer("Enter Continue  Esc Back  Q Quit"),
+        )
+
+        while True:
+            key, char = read()
+            if key == Key.ENTER:
+                return True
+            elif key == Key.ESC:
+                return False
+            elif key == Key.CHAR and char in ("q", "Q"):
+                raise QuitOnboardingError()
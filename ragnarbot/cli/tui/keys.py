@@ -1,8 +1,17 @@
 """Raw keyboard input handling for TUI."""
 
+import os
+import select
 import sys
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
 from enum import Enum
 
+if sys.platform != "win32":
+    import termios
+    import tty
+
 
 class Key(Enum):
     UP = "up"
@@ -18,7 +27,16 @@ class Key(Enum):
 _key_reader = None
 
 # Buffer for pasted characters (drained from fd before leaving raw mode)
-_input_buffer: list[tuple[Key, str]] = []
+_input_buffer: deque[tuple[Key, str]] = deque()
+
+# True while a raw_mode() block holds the terminal in raw mode
+_raw_active = False
+
+# Bytes requested per read; a read returns whatever is ready, up to this
+_READ_SIZE = 1024
+
+# Final byte of an arrow key's escape sequence
+_ESCAPE_SEQUENCE_KEYS = {"A": Key.UP, "B": Key.DOWN}
 
 
 def set_key_reader(fn):
@@ -38,6 +56,11 @@ def get_key_reader():
     return _key_reader or read_key
 
 
+def has_buffered() -> bool:
+    """Whether keys from an earlier read (a paste) are still waiting."""
+    return bool(_input_buffer)
+
+
 def _byte_to_key(ch: str) -> tuple[Key, str]:
     """Convert a single character to a Key event."""
     if ch == "\r" or ch == "\n":
@@ -49,61 +72,104 @@ def _byte_to_key(ch: str) -> tuple[Key, str]:
     return (Key.CHAR, ch)
 
 
+@contextmanager
+def raw_mode():
+    """Hold stdin in raw mode for the duration of a screen.
+
+    Entering once per screen instead of once per keypress saves three
+    termios calls per key. Output post-processing is kept on so Rich's
+    newlines still return the cursor to column 0. No-op when a key reader
+    is injected or stdin is not a terminal.
+    """
+    global _raw_active
+
+    if _raw_active or _key_reader is not None or not sys.stdin.isatty():
+        yield
+        return
+
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        attrs = termios.tcgetattr(fd)
+        attrs[1] |= termios.OPOST
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+        _raw_active = True
+        yield
+    finally:
+        _raw_active = False
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
 def read_key() -> tuple[Key, str]:
     """Read a single keypress from stdin.
 
     Returns (Key, char_value) where char_value is the actual character
     for Key.CHAR events, empty string otherwise.
 
+    Expects to run inside raw_mode(); outside one, it enters raw mode
+    just for this key.
+
     On paste (multiple bytes available at once), all bytes are drained
-    from the fd while still in raw mode and buffered. Subsequent calls
-    return from the buffer without re-entering raw mode.
+    from the fd and buffered. Subsequent calls return from the buffer
+    without touching the fd.
     """
-    global _input_buffer
-
     # Return buffered keys first (from a previous paste)
     if _input_buffer:
-        return _input_buffer.pop(0)
+        return _input_buffer.popleft()
 
-    import os
-    import select
-    import termios
-    import tty
+    if _raw_active:
+        return _read_raw()
+    with raw_mode():
+        return _read_raw()
 
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
-    try:
-        tty.setraw(fd)
-        b = os.read(fd, 1)
-        ch = b.decode("utf-8", errors="replace")
-
-        if ch == "\x1b":
-            # Could be ESC or start of arrow/escape sequence
-            if select.select([fd], [], [], 0.05)[0]:
-                seq = os.read(fd, 2)
-                if seq == b"[A":
-                    return (Key.UP, "")
-                elif seq == b"[B":
-                    return (Key.DOWN, "")
-                return (Key.ESC, "")
-            return (Key.ESC, "")
-
-        first = _byte_to_key(ch)
-
-        # Drain any remaining bytes (paste buffer) while still in raw mode
-        while select.select([fd], [], [], 0)[0]:
-            more_b = os.read(fd, 1)
-            more_ch = more_b.decode("utf-8", errors="replace")
-            if more_ch == "\x1b":
-                # Skip escape sequences embedded in paste
-                if select.select([fd], [], [], 0.01)[0]:
-                    os.read(fd, 2)
-                continue
-            if more_ch in ("\r", "\n"):
-                continue  # skip newlines from terminal line-wrapping in paste
-            _input_buffer.append(_byte_to_key(more_ch))
-
-        return first
 
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+def _read_raw() -> tuple[Key, str]:
+    """Read the next key from stdin, which is already in raw mode.
+
+    Everything the terminal has ready is read in one go, so an arrow key's
+    escape sequence costs one read instead of three.
+    """
+    fd = sys.stdin.fileno()
+    data = os.read(fd, _READ_SIZE)
+    if not data:
+        return (Key.CHAR, "")
+    if data == b"\x1b" and select.select([fd], [], [], 0.05)[0]:
+        # A lone ESC may be the start of a sequence split across reads
+        data += os.read(fd, _READ_SIZE)
+
+    # Drain any remaining bytes (paste buffer) while still in raw mode
+    while select.select([fd], [], [], 0)[0]:
+        more = os.read(fd, _READ_SIZE)
+        if not more:
+            break
+        data += more
+
+    keys = _parse_keys(data.decode("utf-8", errors="replace"))
+    first = next(keys)
+    for key in keys:
+        # Skip newlines from terminal line-wrapping and stray escape
+        # sequences embedded in a paste; arrows typed ahead are kept.
+        if key[0] is not Key.ENTER and key[0] is not Key.ESC:
+            _input_buffer.append(key)
+    return first
+
+
+def _parse_keys(text: str) -> Iterator[tuple[Key, str]]:
+    """Split a chunk of raw terminal input into key events."""
+    i, n = 0, len(text)
+    while i < n:
+        ch = text[i]
+        if ch != "\x1b":
+            yield _byte_to_key(ch)
+            i += 1
+        elif i + 1 < n and text[i + 1] in "[O":
+            # CSI/SS3 sequence: parameter bytes, then a final byte in @..~
+            j = i + 2
+            while j < n and text[j] < "@":
+                j += 1
+            yield (_ESCAPE_SEQUENCE_KEYS.get(text[j : j + 1], Key.ESC), "")
+            i = j + 1
+        else:
+            yield (Key.ESC, "")
+            i += 1
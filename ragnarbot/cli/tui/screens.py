@@ -1,11 +1,18 @@
 """Onboarding screen functions."""
 
-import httpx
+import functools
+import sys
+
 from rich.console import Console
 
 from ragnarbot.cli.tui.components import info_screen, select_menu, text_input
 from ragnarbot.config.providers import PROVIDERS, get_models, get_provider
 
+_TELEGRAM_GET_ME_URL = "https://api.telegram.org/bot{token}/getMe"
+
+# Service manager used for the gateway daemon, or None where unsupported
+_DAEMON_BACKEND = {"darwin": "launchd", "linux": "systemd"}.get(sys.platform)
+
 
 def provider_screen(console: Console) -> int | None:
     """Select LLM provider. Returns index or None (back)."""
@@ -93,13 +100,24 @@ def telegram_screen(console: Console) -> str | None:
     return _validate_telegram_token(console, token)
 
 
+@functools.cache
+def _telegram_client():
+    """HTTP client shared by token checks, so a retry reuses the connection."""
+    import atexit
+
+    import httpx
+
+    client = httpx.Client(timeout=10)
+    atexit.register(client.close)
+    return client
+
+
 def _validate_telegram_token(console: Console, token: str) -> str | None:
     """Validate a Telegram bot token. Returns token if valid, None to retry."""
+    import httpx
+
     try:
-        resp = httpx.get(
-            f"https://api.telegram.org/bot{token}/getMe",
-            timeout=10,
-        )
+        resp = _telegram_client().get(_TELEGRAM_GET_ME_URL.format(token=token))
         data = resp.json()
         if data.get("ok"):
             bot = data["result"]
@@ -200,9 +218,7 @@ def web_search_screen(console: Console) -> str | None:
 
 def daemon_screen(console: Console) -> int | None:
     """Auto-start daemon setup. Returns 0 (yes) or 1 (no), None for back."""
-    import sys
-
-    if sys.platform not in ("darwin", "linux"):
+    if _DAEMON_BACKEND is None:
         info_screen(
             console,
             "Auto-start not available",
@@ -216,9 +232,8 @@ def daemon_screen(console: Console) -> int | None:
         )
         return 1  # "no" — continue without daemon
 
-    platform_name = "launchd" if sys.platform == "darwin" else "systemd"
     options = [
-        ("Yes, enable auto-start", f"Starts on boot, auto-restarts on crash (uses {platform_name})"),
+        ("Yes, enable auto-start", f"Starts on boot, auto-restarts on crash (uses {_DAEMON_BACKEND})"),
         ("No, I'll start manually", "Use 'ragnarbot gateway' when needed"),
     ]
     return select_menu(
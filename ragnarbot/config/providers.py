@@ -65,17 +65,17 @@ PROVIDERS = [
 ]
 
 
+_PROVIDERS_BY_ID = {p["id"]: p for p in PROVIDERS}
+
+
 def get_provider(provider_id: str) -> dict | None:
     """Get a provider by ID."""
-    for p in PROVIDERS:
-        if p["id"] == provider_id:
-            return p
-    return None
+    return _PROVIDERS_BY_ID.get(provider_id)
 
 
 def get_models(provider_id: str) -> list[dict]:
     """Get models for a provider."""
-    provider = get_provider(provider_id)
+    provider = _PROVIDERS_BY_ID.get(provider_id)
     if provider:
         return provider["models"]
     return []
@@ -27,7 +27,7 @@ class ChannelsConfig(BaseModel):
     web: WebConfig = Field(default_factory=WebConfig)
 
 
-OAUTH_SUPPORTED_PROVIDERS = {"anthropic"}
+OAUTH_SUPPORTED_PROVIDERS = frozenset({"anthropic"})
 
 
 class AgentDefaults(BaseModel):
@@ -42,6 +42,12 @@ class AgentDefaults(BaseModel):
     debounce_seconds: float = 0.5  # Batch rapid-fire messages into a single LLM turn
     context_mode: str = Field(default="normal", pattern="^(eco|normal|full)$")
 
+    @property
+    def provider_name(self) -> str:
+        """Provider prefix of the model (bare model names mean anthropic)."""
+        provider, sep, _ = self.model.partition("/")
+        return provider if sep else "anthropic"
+
 
 class AgentsConfig(BaseModel):
     """Agent configuration."""
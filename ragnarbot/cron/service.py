@@ -11,6 +11,22 @@ from loguru import logger
 
 from ragnarbot.cron.types import CronJob, CronJobState, CronPayload, CronSchedule, CronStore
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(data: dict) -> bytes:
+        """Serialize the job store as indented UTF-8 JSON."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # optional fast JSON; stdlib fallback
+    _loads = json.loads
+
+    def _dumps(data: dict) -> bytes:
+        """Serialize the job store as indented UTF-8 JSON."""
+        return json.dumps(data, indent=2).encode()
+
 
 def _now_ms() -> int:
     return int(time.time() * 1000)
@@ -60,7 +76,7 @@ class CronService:
         
         if self.store_path.exists():
             try:
-                data = json.loads(self.store_path.read_text())
+                data = _loads(self.store_path.read_bytes())
                 jobs = []
                 for j in data.get("jobs", []):
                     jobs.append(CronJob(
@@ -142,7 +158,7 @@ class CronService:
             ]
         }
         
-        self.store_path.write_text(json.dumps(data, indent=2))
+        self.store_path.write_bytes(_dumps(data))
     
     async def start(self) -> None:
         """Start the cron service."""
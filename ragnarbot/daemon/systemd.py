@@ -70,18 +70,7 @@ WantedBy=default.target
             return DaemonInfo(status=DaemonStatus.NOT_INSTALLED)
 
         log_dir = get_log_dir()
-        try:
-            result = subprocess.run(
-                ["systemctl", "--user", "is-active", UNIT_NAME],
-                capture_output=True, text=True,
-            )
-            active = result.stdout.strip() == "active"
-        except FileNotFoundError:
-            active = False
-
-        pid = None
-        if active:
-            pid = self._get_pid()
+        active, pid = self._query()
 
         return DaemonInfo(
             status=DaemonStatus.RUNNING if active else DaemonStatus.STOPPED,
@@ -93,20 +82,26 @@ WantedBy=default.target
     def is_installed(self) -> bool:
         return UNIT_PATH.exists()
 
-    def _get_pid(self) -> int | None:
+    def _query(self) -> tuple[bool, int | None]:
+        """Return (active, main_pid) from a single ``systemctl show`` call."""
         try:
             result = subprocess.run(
-                ["systemctl", "--user", "show", "-p", "MainPID", UNIT_NAME],
+                ["systemctl", "--user", "show", "-p", "ActiveState", "-p", "MainPID", UNIT_NAME],
                 capture_output=True, text=True,
             )
-            # Output: MainPID=12345
-            for line in result.stdout.splitlines():
-                if line.startswith("MainPID="):
-                    pid = int(line.split("=", 1)[1])
-                    return pid if pid > 0 else None
-        except (FileNotFoundError, ValueError):
-            pass
-        return None
+        except FileNotFoundError:
+            return False, None
+
+        # Output: ActiveState=active\nMainPID=12345
+        props = dict(
+            line.split("=", 1) for line in result.stdout.splitlines() if "=" in line
+        )
+        active = props.get("ActiveState") == "active"
+        try:
+            pid = int(props.get("MainPID", "0"))
+        except ValueError:
+            pid = 0
+        return active, (pid if active and pid > 0 else None)
 
     @staticmethod
     def _ctl(*args: str) -> None:
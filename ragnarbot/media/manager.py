@@ -1,5 +1,8 @@
 """Central media manager for file storage and downloads."""
 
+import asyncio
+import hashlib
+import shutil
 import time
 from pathlib import Path
 from typing import Awaitable, Callable
@@ -18,7 +21,7 @@ class MediaManager:
         base_dir/
         └── {session_key}/
             ├── photos/
-            │   └── photo_1738934400.jpg
+            │   └── photo_3f7a9c0e12d4b856.jpg
             └── files/
                 ├── report.pdf
                 └── data.csv
@@ -32,6 +35,23 @@ class MediaManager:
         """Register a download callback for a channel."""
         self._download_callbacks[channel] = cb
 
+    async def fetch(self, file_id: str, channel: str) -> bytes:
+        """Download a file's bytes via the channel's callback without saving it.
+
+        Args:
+            file_id: Platform-specific file identifier.
+            channel: Channel name (e.g. "telegram").
+
+        Returns:
+            The raw file bytes.
+        """
+        cb = self._download_callbacks.get(channel)
+        if not cb:
+            raise RuntimeError(f"No download callback registered for channel '{channel}'")
+
+        data, _ = await cb(file_id)
+        return data
+
     async def save_photo(self, session_key: str, data: bytes, ext: str) -> str:
         """Save photo bytes to the session's photos directory.
 
@@ -40,18 +60,52 @@ class MediaManager:
             data: Raw photo bytes.
             ext: File extension (e.g. "jpg", "png").
 
+        Photos are named by content hash, so re-sending the same image
+        reuses the existing file instead of writing a duplicate.
+
         Returns:
             The filename (not full path) of the saved photo.
         """
         photos_dir = self._base_dir / session_key / "photos"
         photos_dir.mkdir(parents=True, exist_ok=True)
 
-        filename = f"photo_{int(time.time())}.{ext}"
-        path = self._unique_path(photos_dir / filename)
-        path.write_bytes(data)
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        path = photos_dir / f"photo_{digest}.{ext}"
+        if path.exists():
+            logger.debug(f"Photo already stored: {path}")
+            return path.name
+
+        await asyncio.to_thread(path.write_bytes, data)
         logger.debug(f"Saved photo: {path}")
         return path.name
 
+    async def store_photo(self, session_key: str, src: Path, ext: str) -> str:
+        """Move an already-downloaded photo into the session's photos directory.
+
+        Like save_photo, but takes a file on disk so the image never has to be
+        held in memory. The file is hashed in chunks and moved (or dropped, if
+        an identical photo is already stored).
+
+        Returns:
+            The filename (not full path) of the stored photo.
+        """
+        photos_dir = self._base_dir / session_key / "photos"
+
+        def _store() -> Path:
+            photos_dir.mkdir(parents=True, exist_ok=True)
+            with src.open("rb") as f:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()[:16]
+            path = photos_dir / f"photo_{digest}.{ext}"
+            if path.exists():
+                src.unlink(missing_ok=True)
+            else:
+                shutil.move(src, path)
+            return path
+
+        path = await asyncio.to_thread(_store)
+        logger.debug(f"Stored photo: {path}")
+        return path.name
+
     async def download_file(
         self, file_id: str, channel: str, session_key: str, filename: str = ""
     ) -> str:
@@ -77,7 +131,7 @@ class MediaManager:
         files_dir.mkdir(parents=True, exist_ok=True)
 
         path = self._unique_path(files_dir / name)
-        path.write_bytes(data)
+        await asyncio.to_thread(path.write_bytes, data)
         logger.debug(f"Downloaded file: {path}")
         return str(path)
 
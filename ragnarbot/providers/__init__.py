@@ -1,7 +1,25 @@
-"""LLM provider abstraction module."""
+"""LLM provider abstraction module.
 
-from ragnarbot.providers.anthropic_provider import AnthropicProvider
-from ragnarbot.providers.base import LLMProvider, LLMResponse
-from ragnarbot.providers.litellm_provider import LiteLLMProvider
+Exports are resolved lazily (PEP 562): importing ``ragnarbot.providers.base``
+or a single provider doesn't import the others (litellm is the heavy one).
+"""
 
-__all__ = ["AnthropicProvider", "LLMProvider", "LLMResponse", "LiteLLMProvider"]
+import importlib
+
+_EXPORTS = {
+    "AnthropicProvider": "ragnarbot.providers.anthropic_provider",
+    "LLMProvider": "ragnarbot.providers.base",
+    "LLMResponse": "ragnarbot.providers.base",
+    "LiteLLMProvider": "ragnarbot.providers.litellm_provider",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,22 @@
+"""Workspace bootstrapping helpers."""
+
+import shutil
+from pathlib import Path
+
+from rich.console import Console
+
+from ragnarbot.agent.context import DEFAULTS_DIR
+
+
+def create_workspace_templates(workspace: Path, console: Console | None = None) -> None:
+    """Copy default workspace files from workspace_defaults/ if missing."""
+    for default_file in DEFAULTS_DIR.rglob("*"):
+        if not default_file.is_file():
+            continue
+        rel = default_file.relative_to(DEFAULTS_DIR)
+        target = workspace / rel
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(default_file, target)
+            if console:
+                console.print(f"  [dim]Created {rel}[/dim]")
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from ragnarbot.agent import context
 from ragnarbot.agent.context import BUILTIN_DIR, ContextBuilder
 
 
@@ -125,3 +126,36 @@ class TestBuildSystemPrompt:
         cb = ContextBuilder(tmp_path / "workspace")
         prompt = cb.build_system_prompt(channel="cli")
         assert "# Telegram Context" not in prompt
+
+
+class TestImageDataUrlCache:
+    """The process-wide data-URL cache stays small and skips large images."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        context._cached_image_data_url.cache_clear()
+        yield
+        context._cached_image_data_url.cache_clear()
+
+    def test_cache_is_capped(self):
+        assert context._cached_image_data_url.cache_info().maxsize == 8
+
+    def test_small_image_cached(self, tmp_path):
+        photo = tmp_path / "small.jpg"
+        photo.write_bytes(b"\xff\xd8\xff" + b"\x00" * 1024)
+
+        first = context._image_part(photo, "image/jpeg")
+        second = context._image_part(photo, "image/jpeg")
+
+        assert first == second
+        assert first["image_url"]["url"].startswith("data:image/jpeg;base64,")
+        assert context._cached_image_data_url.cache_info().hits == 1
+
+    def test_large_image_not_cached(self, tmp_path):
+        photo = tmp_path / "large.jpg"
+        photo.write_bytes(b"\xff\xd8\xff" + b"\x00" * context._IMAGE_CACHE_MAX_BYTES)
+
+        part = context._image_part(photo, "image/jpeg")
+
+        assert part["image_url"]["url"].startswith("data:image/jpeg;base64,")
+        assert context._cached_image_data_url.cache_info().currsize == 0
@@ -2,7 +2,7 @@
 
 import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -219,6 +219,37 @@ class TestSystemdManager:
             with pytest.raises(DaemonError, match="not installed"):
                 manager.start()
 
+    def test_status_running_single_query(self, tmp_path):
+        from ragnarbot.daemon.systemd import SystemdManager
+
+        unit_path = tmp_path / "ragnarbot-gateway.service"
+        unit_path.touch()
+        result = MagicMock(stdout="ActiveState=active\nMainPID=4242\n")
+        with (
+            patch("ragnarbot.daemon.systemd.UNIT_PATH", unit_path),
+            patch("ragnarbot.daemon.systemd.subprocess.run", return_value=result) as mock_run,
+        ):
+            info = SystemdManager().status()
+
+        assert info.status == DaemonStatus.RUNNING
+        assert info.pid == 4242
+        assert mock_run.call_count == 1
+
+    def test_status_stopped(self, tmp_path):
+        from ragnarbot.daemon.systemd import SystemdManager
+
+        unit_path = tmp_path / "ragnarbot-gateway.service"
+        unit_path.touch()
+        result = MagicMock(stdout="ActiveState=inactive\nMainPID=0\n")
+        with (
+            patch("ragnarbot.daemon.systemd.UNIT_PATH", unit_path),
+            patch("ragnarbot.daemon.systemd.subprocess.run", return_value=result),
+        ):
+            info = SystemdManager().status()
+
+        assert info.status == DaemonStatus.STOPPED
+        assert info.pid is None
+
 
 class TestDaemonConfig:
     def test_default_disabled(self):
@@ -0,0 +1,69 @@
+"""Tests for pending access grant expiry and eviction."""
+
+import json
+
+import pytest
+
+from ragnarbot.auth import grants
+from ragnarbot.auth.grants import GRANT_TTL_SECONDS, MAX_PENDING_GRANTS, PendingGrantStore
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable stand-in for time.time() inside the grants module."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(grants.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PendingGrantStore(path=tmp_path / "pending_grants.json")
+
+
+class TestExpiry:
+
+    def test_code_valid_before_ttl(self, store, clock):
+        code = store.get_or_create("user1", "chat1")
+        clock[0] += GRANT_TTL_SECONDS - 1
+        assert store.validate(code) is not None
+
+    def test_code_expires_after_ttl(self, store, clock):
+        old = store.get_or_create("user1", "chat1")
+        clock[0] += GRANT_TTL_SECONDS // 2
+        fresh = store.get_or_create("user2", "chat2")
+
+        clock[0] += GRANT_TTL_SECONDS // 2 + 1
+
+        assert store.validate(old) is None
+        assert store.validate(fresh) is not None
+
+    def test_expired_user_gets_new_code(self, store, clock):
+        old = store.get_or_create("user1", "chat1")
+        clock[0] += GRANT_TTL_SECONDS + 1
+        new = store.get_or_create("user1", "chat1")
+
+        assert new != old
+        saved = json.loads(store._path.read_text())
+        assert list(saved) == [new]
+
+    def test_legacy_entry_without_timestamp_is_kept(self, store, clock):
+        store._save({"legacy01": {"user_id": "u", "chat_id": "c"}})
+        assert store.validate("legacy01") is not None
+
+
+class TestCap:
+
+    def test_oldest_evicted_over_cap(self, store, clock):
+        codes = []
+        for i in range(MAX_PENDING_GRANTS + 5):
+            codes.append(store.get_or_create(f"user{i}", f"chat{i}"))
+            clock[0] += 1
+
+        saved = json.loads(store._path.read_text())
+        assert len(saved) == MAX_PENDING_GRANTS
+        assert set(saved) == set(codes[5:])
+        for code in codes[:5]:
+            assert store.validate(code) is None
+        assert store.validate(codes[5]) is not None
+        assert store.validate(codes[-1]) is not None
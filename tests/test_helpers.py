@@ -0,0 +1,31 @@
+"""Tests for image MIME sniffing in utils.helpers."""
+
+import pytest
+
+from ragnarbot.utils.helpers import detect_image_mime
+
+
+@pytest.mark.parametrize("data, expected", [
+    (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", "image/png"),
+    (b"\xff\xd8\xff\xe0\x00\x10JFIF\x00", "image/jpeg"),
+    (b"\xff\xd8\xff\xe1\x00\x18Exif\x00", "image/jpeg"),
+    (b"GIF87a\x01\x00\x01\x00", "image/gif"),
+    (b"GIF89a\x01\x00\x01\x00", "image/gif"),
+    (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "image/webp"),
+])
+def test_known_signatures(data, expected):
+    assert detect_image_mime(data) == expected
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"hello world, not an image",
+    b"%PDF-1.7\n",
+    b"\x89PN",              # truncated PNG
+    b"\xff\xd8",            # truncated JPEG
+    b"GIF8",                # truncated GIF
+    b"RIFF\x24\x00\x00\x00WAVE",  # RIFF but not WEBP
+    b"RIFF\x24\x00\x00\x00WE",    # truncated WEBP
+])
+def test_unknown_or_truncated_returns_none(data):
+    assert detect_image_mime(data) is None
@@ -0,0 +1,62 @@
+"""Tests for content-addressed photo storage in MediaManager."""
+
+import pytest
+
+from ragnarbot.media.manager import MediaManager
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+JPEG = b"\xff\xd8\xff\xe0" + b"\x01" * 32
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return MediaManager(base_dir=tmp_path / "media")
+
+
+def _photos(manager, session_key="telegram:1"):
+    return sorted(p.name for p in manager.get_photo_path(session_key, "").iterdir())
+
+
+class TestSavePhoto:
+
+    @pytest.mark.asyncio
+    async def test_same_bytes_saved_once(self, manager):
+        first = await manager.save_photo("telegram:1", PNG, "png")
+        second = await manager.save_photo("telegram:1", PNG, "png")
+
+        assert first == second
+        assert _photos(manager) == [first]
+        assert manager.get_photo_path("telegram:1", first).read_bytes() == PNG
+
+    @pytest.mark.asyncio
+    async def test_different_bytes_saved_separately(self, manager):
+        a = await manager.save_photo("telegram:1", PNG, "png")
+        b = await manager.save_photo("telegram:1", JPEG, "jpg")
+
+        assert a != b
+        assert _photos(manager) == sorted([a, b])
+
+
+class TestStorePhoto:
+
+    @pytest.mark.asyncio
+    async def test_source_moved_into_session(self, manager, tmp_path):
+        src = tmp_path / "staged.jpg"
+        src.write_bytes(JPEG)
+
+        name = await manager.store_photo("telegram:1", src, "jpg")
+
+        assert not src.exists()
+        assert manager.get_photo_path("telegram:1", name).read_bytes() == JPEG
+
+    @pytest.mark.asyncio
+    async def test_duplicate_source_removed(self, manager, tmp_path):
+        saved = await manager.save_photo("telegram:1", JPEG, "jpg")
+        src = tmp_path / "staged.jpg"
+        src.write_bytes(JPEG)
+
+        name = await manager.store_photo("telegram:1", src, "jpg")
+
+        assert name == saved
+        assert not src.exists()
+        assert _photos(manager) == [saved]
@@ -58,7 +58,7 @@ def _patches(tmp_path):
         "get_workspace_path": patch(
             "ragnarbot.utils.helpers.get_workspace_path", return_value=workspace
         ),
-        "create_templates": patch("ragnarbot.cli.commands._create_workspace_templates"),
+        "create_templates": patch("ragnarbot.utils.workspace.create_workspace_templates"),
     }
 
 
@@ -217,6 +217,32 @@ class TestOnboardingFlow:
         config = mock_save_config.call_args[0][0]
         assert config.agents.defaults.auth_method == "api_key"
 
+    def test_back_from_token_skips_auth_for_api_key_provider(self, tmp_path):
+        """Esc on OpenAI's token screen returns to the provider screen."""
+        keys = [
+            (Key.DOWN, ""),         # Navigate to OpenAI
+            (Key.ENTER, ""),        # Select OpenAI (no auth screen)
+            (Key.ESC, ""),          # Back to provider selection
+            (Key.ENTER, ""),        # Select Anthropic (first option)
+            (Key.ENTER, ""),        # Select OAuth
+            *[(Key.CHAR, c) for c in "oauth-token"],
+            (Key.ENTER, ""),        # Confirm token
+            (Key.ENTER, ""),        # Select first model
+            (Key.ENTER, ""),        # Skip telegram
+            (Key.DOWN, ""),         # Voice: past ElevenLabs
+            (Key.DOWN, ""),         # Voice: to Skip
+            (Key.ENTER, ""),        # Select Skip
+            (Key.ENTER, ""),        # Skip web search
+            (Key.DOWN, ""),         # Navigate to "No" (manual start)
+            (Key.ENTER, ""),        # Select manual start
+            (Key.ENTER, ""),        # Confirm summary
+        ]
+        mock_save_config, mock_save_creds = self._run_with_keys(keys, tmp_path)
+
+        config = mock_save_config.call_args[0][0]
+        assert config.agents.defaults.model == "anthropic/claude-opus-4-6"
+        assert config.agents.defaults.auth_method == "oauth"
+
     def test_quit_from_provider_screen(self, tmp_path):
         """Q on first screen should exit cleanly."""
         keys = [
@@ -304,7 +330,7 @@ class TestTelegramValidation:
             p["get_credentials_path"],
             p["get_workspace_path"],
             p["create_templates"],
-            patch("ragnarbot.cli.tui.screens.httpx.get", return_value=mock_response),
+            patch("httpx.Client.get", return_value=mock_response),
         ):
             run_onboarding(con)
 
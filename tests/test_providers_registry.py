@@ -1,6 +1,7 @@
 """Tests for provider models registry."""
 
 from ragnarbot.config.providers import PROVIDERS, get_provider, get_models, supports_oauth
+from ragnarbot.config.schema import AgentDefaults
 
 
 def test_providers_has_three_entries():
@@ -62,3 +63,11 @@ def test_supports_oauth_anthropic():
 def test_supports_oauth_others():
     assert supports_oauth("openai") is False
     assert supports_oauth("gemini") is False
+
+
+def test_agent_defaults_provider_name():
+    assert AgentDefaults(model="openai/gpt-4o").provider_name == "openai"
+    assert AgentDefaults(model="claude-opus-4-6").provider_name == "anthropic"
+    for p in PROVIDERS:
+        for m in p["models"]:
+            assert AgentDefaults(model=m["id"]).provider_name == p["id"]
@@ -0,0 +1,101 @@
+"""Tests for Telegram inbound message handling."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ragnarbot.bus.queue import MessageBus
+from ragnarbot.channels.telegram import TelegramChannel
+from ragnarbot.config.schema import TelegramConfig
+from ragnarbot.media.manager import MediaManager
+
+
+def _photo_update(user_id=42, username="alice", file_id="AgACAgIAAxkBAAIBZ2abcdef"):
+    message = SimpleNamespace(
+        chat_id=1000,
+        message_id=7,
+        text=None,
+        caption=None,
+        photo=[SimpleNamespace(file_id=file_id)],
+        voice=None,
+        audio=None,
+        document=None,
+        reply_to_message=None,
+        forward_origin=None,
+        chat=SimpleNamespace(type="private"),
+    )
+    user = SimpleNamespace(
+        id=user_id, username=username, first_name="A", last_name=None,
+    )
+    return SimpleNamespace(message=message, effective_user=user)
+
+
+def _make_channel(allow_from):
+    bus = MessageBus()
+    channel = TelegramChannel(TelegramConfig(allow_from=allow_from), bus)
+    channel._app = MagicMock()
+    channel._app.bot.get_file = AsyncMock()
+    channel._on_unauthorized = AsyncMock()
+    return channel, bus
+
+
+class TestPhotoStaging:
+
+    @pytest.mark.asyncio
+    async def test_disallowed_sender_photo_not_downloaded(self):
+        channel, bus = _make_channel(allow_from=["someone_else"])
+
+        await channel._on_message(_photo_update(), None)
+
+        channel._app.bot.get_file.assert_not_called()
+        channel._on_unauthorized.assert_awaited_once()
+        assert bus.inbound_size == 0
+
+    @pytest.mark.asyncio
+    async def test_allowed_sender_photo_downloaded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+        channel, bus = _make_channel(allow_from=["alice"])
+        file = MagicMock()
+        file.download_to_drive = AsyncMock()
+        channel._app.bot.get_file.return_value = file
+
+        await channel._on_message(_photo_update(), None)
+
+        channel._app.bot.get_file.assert_awaited_once()
+        msg = await bus.consume_inbound()
+        assert [a.type for a in msg.attachments] == ["photo"]
+        assert msg.attachments[0].path.parent == tmp_path / ".ragnarbot" / "media"
+
+    @pytest.mark.asyncio
+    async def test_photos_with_shared_file_id_prefix_both_stored(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+        channel, bus = _make_channel(allow_from=["alice"])
+        contents = {
+            "AgACAgIAAxkBAAIBZ2aaaaaa": b"\xff\xd8\xff first photo",
+            "AgACAgIAAxkBAAIBZ2bbbbbb": b"\xff\xd8\xff second photo",
+        }
+
+        async def get_file(file_id):
+            async def download_to_drive(path):
+                Path(path).write_bytes(contents[file_id])
+            return SimpleNamespace(download_to_drive=download_to_drive)
+
+        channel._app.bot.get_file = get_file
+
+        # Both are staged before either is moved, as within one debounce window
+        for file_id in contents:
+            await channel._on_message(_photo_update(file_id=file_id), None)
+        first = await bus.consume_inbound()
+        second = await bus.consume_inbound()
+
+        manager = MediaManager(base_dir=tmp_path / "sessions")
+        for msg in (first, second):
+            att = msg.attachments[0]
+            await manager.store_photo("telegram:1000", att.path, "jpg")
+
+        photos_dir = manager.get_photo_path("telegram:1000", "")
+        stored = sorted(p.read_bytes() for p in photos_dir.iterdir())
+        assert stored == sorted(contents.values())
+        assert list((tmp_path / ".ragnarbot" / "media").iterdir()) == []
@@ -4,7 +4,7 @@ import pytest
 from io import StringIO
 from rich.console import Console
 
-from ragnarbot.cli.tui.keys import Key, set_key_reader, clear_key_reader
+from ragnarbot.cli.tui.keys import Key, _parse_keys, set_key_reader, clear_key_reader
 from ragnarbot.cli.tui.components import (
     select_menu,
     text_input,
@@ -186,3 +186,23 @@ class TestInfoScreen:
         con = make_console()
         with pytest.raises(QuitOnboardingError):
             info_screen(con, "Info", ["line1"])
+
+
+class TestParseKeys:
+    def test_arrow_sequences(self):
+        assert list(_parse_keys("\x1b[A\x1b[B\x1bOB")) == [
+            (Key.UP, ""),
+            (Key.DOWN, ""),
+            (Key.DOWN, ""),
+        ]
+
+    def test_lone_esc_and_unknown_sequence(self):
+        assert list(_parse_keys("\x1b")) == [(Key.ESC, "")]
+        assert list(_parse_keys("\x1b[C")) == [(Key.ESC, "")]
+
+    def test_pasted_text_keeps_multibyte_chars(self):
+        assert list(_parse_keys("aé\r")) == [
+            (Key.CHAR, "a"),
+            (Key.CHAR, "é"),
+            (Key.ENTER, ""),
+        ]
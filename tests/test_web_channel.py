@@ -0,0 +1,45 @@
+"""Tests for the web channel's WebSocket frame handling."""
+
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from ragnarbot.bus.queue import MessageBus
+from ragnarbot.channels import web as web_channel
+from ragnarbot.channels.web import WebChannel
+from ragnarbot.config.schema import WebConfig
+
+
+@pytest.fixture(params=["default", "stdlib"])
+async def ws_client(request, monkeypatch):
+    if request.param == "stdlib":
+        # orjson is optional; exercise the json.loads fallback as well
+        monkeypatch.setattr(web_channel, "_loads", json.loads)
+    channel = WebChannel(WebConfig(enabled=True), MessageBus())
+    app = web.Application()
+    app.router.add_get("/ws", channel._handle_websocket)
+    client = TestClient(TestServer(app))
+    await client.start_server()
+    yield client
+    await client.close()
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [b"\x80bad", b"not json", "not json", "[]", "1", '"hello"'],
+)
+async def test_invalid_frame_returns_error_and_keeps_connection(ws_client, frame):
+    ws = await ws_client.ws_connect("/ws")
+    if isinstance(frame, bytes):
+        await ws.send_bytes(frame)
+    else:
+        await ws.send_str(frame)
+    reply = await ws.receive_json(timeout=2)
+    assert reply["type"] == "error"
+
+    # The connection survives and still handles valid frames
+    await ws.send_json({"type": "hello", "chat_id": "abc123"})
+    assert await ws.receive_json(timeout=2) == {"type": "hello", "chat_id": "abc123"}
+    await ws.close()